@@ -16,6 +16,19 @@ def read_requirements():
     with open('requirements.txt', 'r', encoding='utf-8') as f:
         return [line.strip() for line in f if line.strip() and not line.startswith('#')]
 
+# Opt-in ahead-of-time compilation of the startup modules, as Black does:
+# SEARCHENGINE_USE_MYPYC=1 pip install .
+ext_modules = []
+if os.environ.get("SEARCHENGINE_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        # Only these modules are compiled; the rest are checked as imports
+        "--ignore-missing-imports",
+        "--follow-imports=silent",
+        "src/searchengine/main.py",
+        "src/searchengine/utils/config.py",
+    ])
+
 setup(
     name="searchengine-pro",
     version="3.2.0",
@@ -27,6 +40,7 @@ setup(
     url="https://github.com/searchengine-pro/searchengine-pro",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -58,9 +72,16 @@ setup(
             "sphinx>=7.1.0",
             "sphinx-rtd-theme>=1.3.0",
         ],
+        "speedups": [
+            "pyahocorasick>=2.0.0",
+            "xxhash>=3.0.0",
+            "msgspec>=0.18.0",
+            "orjson>=3.9.0",
+        ],
         "apis": [
             "google-api-python-client>=2.100.0",
             "duckduckgo-search>=3.9.0",
+            "selectolax>=0.3.17",
         ],
     },
     entry_points={
@@ -10,10 +10,24 @@ __author__ = "SearchEngine Pro Team"
 __email__ = "dev@searchengine-pro.com"
 __license__ = "MIT"
 
-from .core.engine import WebSearchEngine
-from .core.models import SearchResult, SearchFilter
-from .ui.console import ConsoleInterface
-from .utils.config import Config
+from typing import TYPE_CHECKING
+
+from .utils.helpers import lazy_exports
+
+if TYPE_CHECKING:
+    from .core.engine import WebSearchEngine
+    from .core.models import SearchResult, SearchFilter
+    from .ui.console import ConsoleInterface
+    from .utils.config import Config
+
+# Submodules are imported on first attribute access to keep startup fast
+_LAZY_EXPORTS = {
+    "WebSearchEngine": ".core.engine",
+    "SearchResult": ".core.models",
+    "SearchFilter": ".core.models",
+    "ConsoleInterface": ".ui.console",
+    "Config": ".utils.config",
+}
 
 __all__ = [
     "WebSearchEngine",
@@ -21,4 +35,6 @@ __all__ = [
     "SearchFilter",
     "ConsoleInterface",
     "Config",
-] 
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -5,12 +5,27 @@ This module handles external API integrations, HTTP clients,
 search providers, and result parsing.
 """
 
-from .providers import SearchProviderManager, SimulationProvider, GoogleSearchProvider
-from .client import HTTPClient
+from typing import TYPE_CHECKING
+
+from ..utils.helpers import lazy_exports
+
+if TYPE_CHECKING:
+    from .providers import SearchProviderManager, SimulationProvider, GoogleSearchProvider
+    from .client import HTTPClient
+
+# Submodules are imported on first attribute access to keep startup fast
+_LAZY_EXPORTS = {
+    "SearchProviderManager": ".providers",
+    "SimulationProvider": ".providers",
+    "GoogleSearchProvider": ".providers",
+    "HTTPClient": ".client",
+}
 
 __all__ = [
     "SearchProviderManager",
     "SimulationProvider",
     "GoogleSearchProvider", 
     "HTTPClient",
-] 
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -1,38 +1,80 @@
 """
 SearchEngine Pro - HTTP Client
 
-Simple HTTP client for making API requests with timeout and retry support.
+Shared HTTP client for making requests with timeout support. A single
+aiohttp session (and its connection pool) is shared by every provider.
 """
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
 from ..utils.config import Config
+from ..utils import serialization
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# aiohttp is imported on first use to keep startup fast
+AIOHTTP_AVAILABLE = find_spec("aiohttp") is not None
 
 logger = logging.getLogger(__name__)
 
 
 class HTTPClient:
-    """Simple HTTP client"""
+    """HTTP client wrapping a shared aiohttp session"""
     
     def __init__(self, config: Config):
         self.config = config
         self.timeout = config.search.default_timeout
         self.user_agent = config.search.user_agent
+        # Created lazily on first use so it binds to the running event loop
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def available(self) -> bool:
+        """Whether real HTTP requests can be made"""
+        return AIOHTTP_AVAILABLE
+    
+    async def get_session(self) -> "aiohttp.ClientSession":
+        """Get the shared session, creating it for the current event loop"""
+        import aiohttp
+        
+        # No await happens between the check and the assignment, so concurrent
+        # callers on the same loop cannot create duplicate sessions
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # A session cannot outlive the loop it was created on
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75, ttl_dns_cache=300),
+                headers={'User-Agent': self.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._session_loop = loop
+        return self._session
     
     async def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Make GET request"""
-        # Simplified implementation - in real use, would use aiohttp
-        await asyncio.sleep(0.1)  # Simulate network delay
-        return {"status": "simulated", "data": {}}
+        session = await self.get_session()
+        async with session.get(url, headers=headers) as response:
+            return {"status": response.status, "data": await self._read_body(response)}
     
     async def post(self, url: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Make POST request"""
-        # Simplified implementation
-        await asyncio.sleep(0.1)
-        return {"status": "simulated", "data": {}}
+        session = await self.get_session()
+        async with session.post(url, json=data, headers=headers) as response:
+            return {"status": response.status, "data": await self._read_body(response)}
+    
+    async def _read_body(self, response: "aiohttp.ClientResponse") -> Any:
+        """Decode a response body as JSON when possible, text otherwise"""
+        if response.content_type == "application/json":
+            return await response.json(loads=serialization.loads)
+        return await response.text()
     
     async def close(self):
         """Clean up resources"""
-        pass 
\ No newline at end of file
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,147 @@
+"""
+Result parsers for SearchEngine Pro
+
+Lightweight extraction of page metadata (title, description) from raw
+HTML. A precompiled regex pass over the byte buffer handles the common
+case; a full HTML parser is only used when the regexes cannot decide.
+"""
+
+import html
+import logging
+import re
+from importlib.util import find_spec
+from typing import Optional, Tuple
+
+# Full parsers are only needed for the fallback path, so import them lazily
+SELECTOLAX_AVAILABLE = find_spec("selectolax") is not None
+BS4_AVAILABLE = find_spec("bs4") is not None
+HTML_PARSER = 'lxml' if find_spec("lxml") is not None else 'html.parser'
+
+logger = logging.getLogger(__name__)
+
+_TITLE_RE = re.compile(rb'<title[^>]*>(.*?)</title>', re.I | re.S)
+_META_RE = re.compile(rb'<meta\b[^>]*>', re.I)
+_ATTR_RE = re.compile(rb'''([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''')
+_PARAGRAPH_RE = re.compile(rb'<p\b[^>]*>(.*?)</p>', re.I | re.S)
+_TAG_RE = re.compile(rb'<[^>]+>')
+
+
+def _decode(raw: bytes, encoding: str) -> str:
+    """Decode a byte fragment and resolve HTML entities"""
+    try:
+        text = raw.decode(encoding, errors='replace')
+    except LookupError:
+        text = raw.decode('utf-8', errors='replace')
+    return html.unescape(text)
+
+
+def _find_meta_description(body: bytes) -> Optional[bytes]:
+    """Return the raw content of <meta name="description">, if present"""
+    for match in _META_RE.finditer(body):
+        attrs = {}
+        for attr in _ATTR_RE.finditer(match.group(0)):
+            value = attr.group(2)
+            if value is None:
+                value = attr.group(3) if attr.group(3) is not None else attr.group(4)
+            attrs[attr.group(1).lower()] = value
+        if attrs.get(b'name', b'').lower() == b'description':
+            return attrs.get(b'content', b'')
+    return None
+
+
+def _parse_with_regex(body: bytes, encoding: str) -> Tuple[Optional[str], str, bool]:
+    """Regex extraction; the last item is False when the result is ambiguous"""
+    title = None
+    title_match = _TITLE_RE.search(body)
+    if title_match:
+        title = _decode(_TAG_RE.sub(b'', title_match.group(1)), encoding).strip()
+    
+    description = ""
+    meta_content = _find_meta_description(body)
+    if meta_content:
+        description = _decode(meta_content, encoding)
+    
+    paragraph_found = True
+    if not description:
+        p_match = _PARAGRAPH_RE.search(body)
+        if p_match:
+            description = _decode(_TAG_RE.sub(b'', p_match.group(1)), encoding)[:200] + "..."
+        else:
+            paragraph_found = False
+    
+    return title, description, title_match is not None and paragraph_found
+
+
+def _parse_with_selectolax(body: bytes) -> Tuple[Optional[str], str]:
+    """Full parse using selectolax"""
+    from selectolax.parser import HTMLParser
+    
+    tree = HTMLParser(body)
+    
+    title_node = tree.css_first('title')
+    title = title_node.text().strip() if title_node else None
+    
+    description = ""
+    meta_node = tree.css_first('meta[name="description"]')
+    if meta_node:
+        description = meta_node.attributes.get('content') or ""
+    
+    if not description:
+        p_node = tree.css_first('p')
+        if p_node:
+            description = p_node.text()[:200] + "..."
+    
+    return title, description
+
+
+def _parse_with_bs4(body: bytes) -> Tuple[Optional[str], str]:
+    """Full parse using BeautifulSoup"""
+    from bs4 import BeautifulSoup, SoupStrainer
+    
+    # Only the tags used for metadata are kept in the parse tree
+    soup = BeautifulSoup(body, HTML_PARSER, parse_only=SoupStrainer(['title', 'meta', 'p']))
+    
+    title_tag = soup.find('title')
+    title = title_tag.get_text().strip() if title_tag else None
+    
+    description = ""
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    if meta_desc:
+        description = str(meta_desc.get('content') or '')
+    
+    if not description:
+        first_p = soup.find('p')
+        if first_p:
+            description = first_p.get_text()[:200] + "..."
+    
+    return title, description
+
+
+def extract_metadata_fast(body: bytes, encoding: Optional[str] = None) -> Optional[Tuple[Optional[str], str]]:
+    """
+    Extract metadata with the regex pass only.
+    
+    Returns None when the result is ambiguous and a full parse is needed.
+    """
+    title, description, complete = _parse_with_regex(body, encoding or 'utf-8')
+    return (title, description) if complete else None
+
+
+def extract_metadata_full(body: bytes, encoding: Optional[str] = None) -> Tuple[Optional[str], str]:
+    """
+    Extract metadata with a full HTML parser.
+    
+    Falls back to the regex result when no parser is installed or parsing
+    fails. This is CPU-bound, so async callers should run it in an executor.
+    """
+    try:
+        if SELECTOLAX_AVAILABLE:
+            return _parse_with_selectolax(body)
+        if BS4_AVAILABLE:
+            return _parse_with_bs4(body)
+    except Exception as e:
+        logger.debug(f"HTML parser fallback failed: {e}")
+    
+    title, description, _ = _parse_with_regex(body, encoding or 'utf-8')
+    return title, description
+
@@ -7,31 +7,70 @@ and real API integrations.
 
 import asyncio
 import logging
-import requests
-from typing import List, Dict, Any, Tuple
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from importlib.util import find_spec
 import time
 import re
-from urllib.parse import urlparse
 
-from ..core.models import SearchQuery, SearchFilter, ResultType
+from ..core.models import RawResult, SearchQuery, SearchFilter, ResultType
 from ..utils.config import Config
+from ..utils.batching import AsyncBatcher
+from ..utils.cache import LRUCache, MetadataCache
+from ..utils import serialization
+from .client import HTTPClient
+from .parsers import extract_metadata_fast, extract_metadata_full
 
-try:
-    from googlesearch import search as google_search
-    from bs4 import BeautifulSoup
-    GOOGLE_AVAILABLE = True
-except ImportError:
-    GOOGLE_AVAILABLE = False
+if TYPE_CHECKING:
+    import aiohttp
+
+# Optional dependencies are only probed here; they are imported on first
+# use so that startup (and the simulation provider) doesn't pay for them
+GOOGLE_AVAILABLE = find_spec("googlesearch") is not None
 
 logger = logging.getLogger(__name__)
 
+# Per-page budget for metadata fetches, in seconds
+_METADATA_TIMEOUT = 5
+
+# Only the start of a page is downloaded when looking for its metadata
+_MAX_HTML_BYTES = 64 * 1024
+_HTML_CONTENT_TYPES = frozenset(("text/html", "application/xhtml+xml"))
+
+# Micro-batching of upstream Google searches
+_SEARCH_BATCH_SIZE = 8
+_SEARCH_BATCH_WAIT_MS = 20
+_SEARCH_CONCURRENCY = 4
+
+# Query operators added for each content type filter
+_CONTENT_TYPE_QUERY = {
+    "pdf": "filetype:pdf",
+    "doc": "filetype:doc OR filetype:docx",
+    "news": "site:news.google.com OR site:reuters.com OR site:bbc.com",
+}
+
+# Host part of a URL, without userinfo, port or a leading "www."; IPv6
+# literals keep their brackets
+_HOST_RE = re.compile(
+    r'[a-z][a-z0-9+.-]*://(?:[^/?#@]*@)?(?:www\.)?(\[[^\]]*\]|[^/:?#@]+)', re.IGNORECASE
+)
+
+# Alternatives are tried in order, so earlier groups take precedence
+_CONTENT_TYPE_RE = re.compile(
+    r'(?P<pdf>.*\.pdf\Z)'
+    r'|(?=.*(?P<doc>\.doc))'
+    r'|(?=.*(?P<news>news\.|bbc\.|reuters\.|cnn\.))'
+    r'|(?=.*(?P<video>youtube\.|vimeo\.))',
+    re.IGNORECASE | re.DOTALL
+)
+
 
 class SearchProvider(ABC):
     """Abstract base class for search providers"""
     
     @abstractmethod
-    async def search(self, query: SearchQuery, page: int, filters: SearchFilter) -> Tuple[List[Dict[str, Any]], int]:
+    async def search(self, query: SearchQuery, page: int, filters: SearchFilter) -> Tuple[List[RawResult], int]:
         """Perform search and return results"""
         pass
     
@@ -44,109 +83,135 @@ class SearchProvider(ABC):
 class SimulationProvider(SearchProvider):
     """Simulation provider for testing and demo purposes"""
     
+    # Field templates for the generic filler results, in RawResult field order
+    _FILLER_TEMPLATE = RawResult(
+        title="{title} - Resource #{idx}",
+        url="https://www.example{idx}.com/{slug}",
+        snippet="Additional information and resources about {query} with detailed analysis and comprehensive coverage.",
+        source="Source {idx}",
+        date="2024-01-15",
+        type="webpage"
+    )
+    
     def __init__(self, config: Config):
         self.config = config
     
-    async def search(self, query: SearchQuery, page: int, filters: SearchFilter) -> Tuple[List[Dict[str, Any]], int]:
+    async def search(self, query: SearchQuery, page: int, filters: SearchFilter) -> Tuple[List[RawResult], int]:
         """Simulate search results"""
-        await asyncio.sleep(0.2)  # Simulate search delay
+        if self.config.search.simulate_latency:
+            await asyncio.sleep(0.2)  # Simulate search delay
         
         results = []
-        base_index = (page - 1) * self.config.search.results_per_page
+        results_per_page = self.config.search.results_per_page
+        base_index = (page - 1) * results_per_page
+        raw_query = query.raw_query
         
         # Generate realistic results based on query
-        query_text = query.raw_query.lower()
+        query_text = raw_query.lower()
         
         if "python" in query_text:
             results.extend([
-                {
-                    "title": "Python.org - Welcome to Python.org",
-                    "url": "https://www.python.org/",
-                    "snippet": "The official home of the Python Programming Language. Download the latest version, browse documentation, and learn Python programming.",
-                    "source": "python.org",
-                    "date": "2024-01-15",
-                    "type": "webpage"
-                },
-                {
-                    "title": "Python Tutorial - W3Schools",
-                    "url": "https://www.w3schools.com/python/",
-                    "snippet": "Well organized and easy to understand Web building tutorials with lots of examples of how to use HTML, CSS, JavaScript, SQL, Python, PHP, Bootstrap, Java, XML and more.",
-                    "source": "w3schools.com",
-                    "date": "2024-01-10",
-                    "type": "webpage"
-                }
+                RawResult(
+                    title="Python.org - Welcome to Python.org",
+                    url="https://www.python.org/",
+                    snippet="The official home of the Python Programming Language. Download the latest version, browse documentation, and learn Python programming.",
+                    source="python.org",
+                    date="2024-01-15",
+                    type="webpage"
+                ),
+                RawResult(
+                    title="Python Tutorial - W3Schools",
+                    url="https://www.w3schools.com/python/",
+                    snippet="Well organized and easy to understand Web building tutorials with lots of examples of how to use HTML, CSS, JavaScript, SQL, Python, PHP, Bootstrap, Java, XML and more.",
+                    source="w3schools.com",
+                    date="2024-01-10",
+                    type="webpage"
+                )
             ])
         
         elif "news" in query_text or "2024" in query_text:
             results.extend([
-                {
-                    "title": f"Latest News: {query.raw_query.title()} - BBC News",
-                    "url": "https://www.bbc.com/news",
-                    "snippet": "Breaking news, analysis and features from BBC News, including international, UK, business, technology and entertainment news.",
-                    "source": "BBC News",
-                    "date": "2024-01-20",
-                    "type": "news"
-                }
+                RawResult(
+                    title=f"Latest News: {raw_query.title()} - BBC News",
+                    url="https://www.bbc.com/news",
+                    snippet="Breaking news, analysis and features from BBC News, including international, UK, business, technology and entertainment news.",
+                    source="BBC News",
+                    date="2024-01-20",
+                    type="news"
+                )
             ])
         
         elif "how to" in query_text:
             results.extend([
-                {
-                    "title": f"How to {query_text.replace('how to ', '').title()} - WikiHow",
-                    "url": "https://www.wikihow.com",
-                    "snippet": "Detailed step-by-step instructions with helpful tips and illustrations to guide you through the process.",
-                    "source": "WikiHow",
-                    "date": "2024-01-18",
-                    "type": "webpage"
-                }
+                RawResult(
+                    title=f"How to {query_text.replace('how to ', '').title()} - WikiHow",
+                    url="https://www.wikihow.com",
+                    snippet="Detailed step-by-step instructions with helpful tips and illustrations to guide you through the process.",
+                    source="WikiHow",
+                    date="2024-01-18",
+                    type="webpage"
+                )
             ])
         
         # Fill remaining slots with generic results
-        while len(results) < self.config.search.results_per_page:
-            idx = len(results) + base_index + 1
-            results.append({
-                "title": f"{query.raw_query.title()} - Resource #{idx}",
-                "url": f"https://www.example{idx}.com/{query.raw_query.replace(' ', '-')}",
-                "snippet": f"Additional information and resources about {query.raw_query} with detailed analysis and comprehensive coverage.",
-                "source": f"Source {idx}",
-                "date": "2024-01-15",
-                "type": "webpage"
-            })
+        first_idx = len(results) + base_index + 1
+        last_idx = base_index + results_per_page
+        fields = {
+            "title": raw_query.title(),
+            "query": raw_query,
+            "slug": raw_query.replace(' ', '-')
+        }
+        results.extend([
+            RawResult._make(template.format(idx=idx, **fields) for template in self._FILLER_TEMPLATE)
+            for idx in range(first_idx, last_idx + 1)
+        ])
         
         total_results = len(results) * 10 + (page - 1) * 50  # Simulate large result set
         
-        return results[:self.config.search.results_per_page], total_results
+        return results[:results_per_page], total_results
     
     async def get_suggestions(self, partial_query: str) -> List[str]:
         """Get query suggestions"""
-        await asyncio.sleep(0.1)
+        if self.config.search.simulate_latency:
+            await asyncio.sleep(0.1)
         
-        # Simple suggestion logic
-        suggestions = [
+        return list(self._build_suggestions(partial_query))
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _build_suggestions(partial_query: str) -> Tuple[str, ...]:
+        """Simple suggestion logic, memoized per partial query"""
+        return (
             f"{partial_query} tutorial",
             f"{partial_query} examples",
             f"{partial_query} guide",
             f"how to {partial_query}",
             f"{partial_query} best practices"
-        ]
-        
-        return suggestions[:5]
+        )
 
 
 class GoogleSearchProvider(SearchProvider):
     """Real Google search provider using googlesearch-python"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, http_client: HTTPClient):
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': config.search.user_agent
-        })
+        self.http_client = http_client
+        self._meta_cache = MetadataCache(config)
+        # Concurrent searches are collected into small batches and run a few at a time
+        self._search_batcher = AsyncBatcher(
+            self._run_search_batch,
+            max_batch=_SEARCH_BATCH_SIZE,
+            max_wait_ms=_SEARCH_BATCH_WAIT_MS
+        )
+        self._search_slots: Optional[asyncio.Semaphore] = None
+        self._search_slots_loop: Optional[asyncio.AbstractEventLoop] = None
         
         if not GOOGLE_AVAILABLE:
             logger.warning("googlesearch-python not available, falling back to simulation")
+        if not http_client.available:
+            logger.warning("aiohttp not available, result metadata will not be fetched")
     
-    async def search(self, query: SearchQuery, page: int, filters: SearchFilter) -> Tuple[List[Dict[str, Any]], int]:
+    async def search(self, query: SearchQuery, page: int, filters: SearchFilter) -> Tuple[List[RawResult], int]:
         """Perform real Google search"""
         if not GOOGLE_AVAILABLE:
             logger.warning("Google search not available, using simulation")
@@ -154,9 +219,6 @@ class GoogleSearchProvider(SearchProvider):
             return await sim_provider.search(query, page, filters)
         
         try:
-            # Small delay to be respectful to Google
-            await asyncio.sleep(self.config.search.request_delay)
-            
             # Prepare search query
             search_query = self._build_search_query(query, filters)
             
@@ -169,188 +231,280 @@ class GoogleSearchProvider(SearchProvider):
             
             search_results = []
             try:
-                # Get URLs from Google search with pagination support
-                urls = list(google_search(
-                    search_query, 
-                    num_results=results_per_page,
-                    lang='en',
-                    sleep_interval=1,  # Be respectful with delays
-                    timeout=10,
-                    start_num=start_index  # This enables pagination
-                ))
+                # Get URLs from Google search; concurrent callers are batched together
+                urls = await self._search_batcher.submit(
+                    (search_query, results_per_page, start_index)
+                )
                 
-                # Fetch metadata for each URL
-                for i, url in enumerate(urls):
-                    try:
-                        result = await self._fetch_result_metadata(url, i + start_index + 1)
-                        if result:
-                            search_results.append(result)
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch metadata for {url}: {e}")
+                # Fetch metadata for all URLs concurrently, bounded by the semaphore
+                sem = asyncio.Semaphore(max(1, self.config.search.max_concurrent_requests))
+                tasks = [
+                    self._fetch_one(url, i + start_index + 1, sem)
+                    for i, url in enumerate(urls)
+                ]
+                fetched = await asyncio.gather(*tasks, return_exceptions=True)
+                
+                for i, (url, result) in enumerate(zip(urls, fetched)):
+                    if isinstance(result, BaseException):
+                        logger.warning(f"Failed to fetch metadata for {url}: {result}")
                         # Create basic result if metadata fetch fails
-                        search_results.append({
-                            "title": f"Search Result #{i + start_index + 1}",
-                            "url": url,
-                            "snippet": "No description available",
-                            "source": self._extract_domain(url),
-                            "date": "",
-                            "type": "webpage"
-                        })
+                        search_results.append(self._placeholder_result(url, i + start_index + 1))
+                    elif result is not None:
+                        search_results.append(result)
                 
                 # Estimate total results (Google doesn't provide exact count)
                 total_results = min(len(urls) * 10, 1000000)  # Cap at reasonable number
                 
                 logger.info(f"Found {len(search_results)} results for page {page}")
                 return search_results, total_results
-                
+            
             except Exception as e:
                 logger.error(f"Google search failed: {e}")
                 # Fall back to simulation
                 sim_provider = SimulationProvider(self.config)
                 return await sim_provider.search(query, page, filters)
-                
+        
         except Exception as e:
             logger.error(f"Google search error: {e}")
             return [], 0
     
+    async def _run_search_batch(self, requests: List[Tuple[str, int, int]]) -> List[Any]:
+        """Run a batch of Google searches concurrently, a few at a time"""
+        loop = asyncio.get_running_loop()
+        slots = self._search_slots
+        if slots is None or self._search_slots_loop is not loop:
+            # Shared across batches; created per loop for Python < 3.10
+            slots = self._search_slots = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+            self._search_slots_loop = loop
+        
+        async def run_one(search_query: str, num_results: int, start_num: int) -> List[str]:
+            await slots.acquire()
+            try:
+                # googlesearch is blocking, so keep it off the event loop
+                return await loop.run_in_executor(
+                    None, self._google_search, search_query, num_results, start_num
+                )
+            finally:
+                # Keep the slot for a short delay to be respectful to Google,
+                # without holding back this caller's results
+                loop.call_later(self.config.search.request_delay, slots.release)
+        
+        return await asyncio.gather(
+            *(run_one(*request) for request in requests),
+            return_exceptions=True
+        )
+    
+    @staticmethod
+    def _google_search(search_query: str, num_results: int, start_num: int) -> List[str]:
+        """Get result URLs from Google search with pagination support"""
+        from googlesearch import search as google_search
+        
+        return list(google_search(
+            search_query, 
+            num_results=num_results,
+            lang='en',
+            sleep_interval=1,  # Be respectful with delays
+            timeout=10,
+            start_num=start_num  # This enables pagination
+        ))
+    
     def _build_search_query(self, query: SearchQuery, filters: SearchFilter) -> str:
         """Build Google search query with filters"""
+        return self._compose_search_query(
+            tuple(query.terms),
+            tuple(query.required_terms),
+            tuple(query.exact_phrases),
+            query.site_filter,
+            query.filetype_filter,
+            filters.content_type,
+            tuple(query.excluded_terms)
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _compose_search_query(
+        terms: Tuple[str, ...],
+        required_terms: Tuple[str, ...],
+        exact_phrases: Tuple[str, ...],
+        site_filter: str,
+        filetype_filter: str,
+        content_type: str,
+        excluded_terms: Tuple[str, ...]
+    ) -> str:
+        """Compose the query string from hashable query parts"""
         search_terms = []
         
         # Add regular terms
-        search_terms.extend(query.terms)
+        search_terms.extend(terms)
         
         # Add required terms
-        for term in query.required_terms:
+        for term in required_terms:
             search_terms.append(f'"{term}"')
         
         # Add exact phrases
-        for phrase in query.exact_phrases:
+        for phrase in exact_phrases:
             search_terms.append(f'"{phrase}"')
         
         # Add site filter
-        if query.site_filter:
-            search_terms.append(f"site:{query.site_filter}")
+        if site_filter:
+            search_terms.append(f"site:{site_filter}")
         
         # Add filetype filter
-        if query.filetype_filter:
-            search_terms.append(f"filetype:{query.filetype_filter}")
+        if filetype_filter:
+            search_terms.append(f"filetype:{filetype_filter}")
         
         # Add content type filters
-        if filters.content_type == "pdf":
-            search_terms.append("filetype:pdf")
-        elif filters.content_type == "doc":
-            search_terms.append("filetype:doc OR filetype:docx")
-        elif filters.content_type == "news":
-            search_terms.append("site:news.google.com OR site:reuters.com OR site:bbc.com")
+        content_type_query = _CONTENT_TYPE_QUERY.get(content_type)
+        if content_type_query:
+            search_terms.append(content_type_query)
         
         # Exclude terms
-        for term in query.excluded_terms:
+        for term in excluded_terms:
             search_terms.append(f"-{term}")
         
         return " ".join(search_terms)
     
-    async def _fetch_result_metadata(self, url: str, index: int) -> Dict[str, Any]:
+    async def _fetch_one(self, url: str, index: int, sem: asyncio.Semaphore) -> Optional[RawResult]:
+        """Fetch metadata for a URL while holding a concurrency slot"""
+        async with sem:
+            return await self._fetch_result_metadata(url, index)
+    
+    async def _fetch_result_metadata(self, url: str, index: int) -> Optional[RawResult]:
         """Fetch metadata for a search result URL"""
+        cached = await self._meta_cache.get(url)
+        if cached is not None:
+            return self._finalize_metadata(RawResult.from_dict(cached), index)
+        
+        if not self.http_client.available:
+            # Without aiohttp the result is listed without its metadata
+            return self._placeholder_result(url, index)
+        
         try:
-            # Use asyncio to run the blocking request
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.session.get(url, timeout=5, allow_redirects=True)
+            import aiohttp
+            
+            session = await self.http_client.get_session()
+            timeout = aiohttp.ClientTimeout(total=_METADATA_TIMEOUT)
+            # Title and meta tags live near the top, so only ask for the first bytes
+            headers = {'Range': f'bytes=0-{_MAX_HTML_BYTES - 1}'}
+            async with session.get(url, allow_redirects=True, timeout=timeout, headers=headers) as response:
+                if response.status not in (200, 206):
+                    return None
+                if response.content_type in _HTML_CONTENT_TYPES:
+                    body = await self._read_capped(response, _MAX_HTML_BYTES)
+                else:
+                    # Not a page we can parse (PDF, image, ...): skip the body
+                    body = b""
+                encoding = response.charset
+            
+            title, description = await self._parse_metadata(body, encoding)
+            
+            metadata = RawResult(
+                title=(title or "")[:100],  # Limit title length
+                url=url,
+                snippet=description[:300] if description else "No description available",
+                source=self._extract_domain(url),
+                date="",  # Could extract from meta tags if available
+                type=self._determine_content_type(url)
             )
+            self._meta_cache.set(url, metadata.to_dict())
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract title
-                title_tag = soup.find('title')
-                title = title_tag.get_text().strip() if title_tag else f"Search Result #{index}"
-                
-                # Extract description from meta tags
-                description = ""
-                meta_desc = soup.find('meta', attrs={'name': 'description'})
-                if meta_desc:
-                    description = meta_desc.get('content', '')
-                
-                # If no meta description, try to get text from first paragraph
-                if not description:
-                    first_p = soup.find('p')
-                    if first_p:
-                        description = first_p.get_text()[:200] + "..."
-                
-                # Extract domain
-                domain = self._extract_domain(url)
-                
-                # Determine content type
-                content_type = self._determine_content_type(url, soup)
-                
-                return {
-                    "title": title[:100],  # Limit title length
-                    "url": url,
-                    "snippet": description[:300] if description else "No description available",
-                    "source": domain,
-                    "date": "",  # Could extract from meta tags if available
-                    "type": content_type
-                }
-            else:
-                return None
-                
+            return self._finalize_metadata(metadata, index)
+        
         except Exception as e:
             logger.debug(f"Failed to fetch metadata for {url}: {e}")
             return None
     
-    def _extract_domain(self, url: str) -> str:
+    @staticmethod
+    async def _parse_metadata(body: bytes, encoding: Optional[str]) -> Tuple[Optional[str], str]:
+        """Extract title and description, keeping full HTML parses off the event loop"""
+        if not body:
+            return None, ""
+        
+        # The regex pass is cheap enough to run inline
+        metadata = extract_metadata_fast(body, encoding)
+        if metadata is not None:
+            return metadata
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, extract_metadata_full, body, encoding)
+    
+    @staticmethod
+    async def _read_capped(response: "aiohttp.ClientResponse", limit: int) -> bytes:
+        """Read at most limit bytes of the body, also if the server ignored Range"""
+        body = bytearray()
+        while len(body) < limit:
+            chunk = await response.content.read(limit - len(body))
+            if not chunk:
+                break
+            body.extend(chunk)
+        return bytes(body)
+    
+    def _placeholder_result(self, url: str, index: int) -> RawResult:
+        """Basic result for a URL whose metadata could not be fetched"""
+        return RawResult(
+            title=f"Search Result #{index}",
+            url=url,
+            snippet="No description available",
+            source=self._extract_domain(url),
+            date="",
+            type="webpage"
+        )
+    
+    def _finalize_metadata(self, metadata: RawResult, index: int) -> RawResult:
+        """Fill in the position-dependent placeholder title"""
+        if not metadata.title:
+            metadata = metadata._replace(title=f"Search Result #{index}")
+        return metadata
+    
+    async def close(self):
+        """Close the metadata cache (the HTTP client is owned by the manager)"""
+        await self._meta_cache.close()
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _extract_domain(url: str) -> str:
         """Extract domain from URL"""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc
-            # Remove www. prefix
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            return domain
-        except:
-            return "Unknown"
-    
-    def _determine_content_type(self, url: str, soup: BeautifulSoup) -> str:
-        """Determine content type from URL and content"""
-        url_lower = url.lower()
-        
-        if url_lower.endswith('.pdf'):
-            return "pdf"
-        elif any(ext in url_lower for ext in ['.doc', '.docx']):
-            return "doc"
-        elif any(domain in url_lower for domain in ['news.', 'bbc.', 'reuters.', 'cnn.']):
-            return "news"
-        elif any(domain in url_lower for domain in ['youtube.', 'vimeo.']):
-            return "video"
-        else:
-            return "webpage"
+        match = _HOST_RE.match(url)
+        return match.group(1).lower() if match else "Unknown"
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _determine_content_type(url: str) -> str:
+        """Determine content type from URL"""
+        match = _CONTENT_TYPE_RE.match(url)
+        return (match.lastgroup if match else None) or "webpage"
     
     async def get_suggestions(self, partial_query: str) -> List[str]:
         """Get query suggestions (simplified)"""
-        await asyncio.sleep(0.1)
+        if self.config.search.simulate_latency:
+            await asyncio.sleep(0.1)
         
-        # Simple suggestion logic based on common patterns
-        suggestions = [
+        return list(self._build_suggestions(partial_query))
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _build_suggestions(partial_query: str) -> Tuple[str, ...]:
+        """Simple suggestion logic based on common patterns, memoized per partial query"""
+        return (
             f"{partial_query} tutorial",
             f"{partial_query} guide",
             f"how to {partial_query}",
             f"{partial_query} examples",
             f"best {partial_query}"
-        ]
-        
-        return suggestions[:5]
+        )
 
 
 class SearchProviderManager:
     """Manages multiple search providers"""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, http_client: Optional[HTTPClient] = None):
         self.config = config
+        # Providers share one client so they share one connection pool
+        self._owns_client = http_client is None
+        self.http_client = http_client or HTTPClient(config)
         self.providers = {
             "simulation": SimulationProvider(config),
-            "google": GoogleSearchProvider(config)
+            "google": GoogleSearchProvider(config, self.http_client)
         }
         # Default to Google if available, otherwise simulation
         if GOOGLE_AVAILABLE and config.api.default_provider == "google":
@@ -359,14 +513,78 @@ class SearchProviderManager:
             self.default_provider = "simulation"
         else:
             self.default_provider = "google" if GOOGLE_AVAILABLE else "simulation"
+        
+        # Raw provider responses keyed by (provider, query, page, filters)
+        self.result_cache = LRUCache(max_size=1024, ttl=600)
+        # Upstream requests currently running, shared by identical callers
+        self._inflight: Dict[Tuple[str, str, int, bytes], "asyncio.Task"] = {}
     
-    async def search(self, query: SearchQuery, page: int, filters: SearchFilter) -> Tuple[List[Dict[str, Any]], int]:
+    async def search(
+        self,
+        query: SearchQuery,
+        page: int,
+        filters: SearchFilter,
+        use_cache: bool = True
+    ) -> Tuple[List[RawResult], int]:
         """Search using the default provider"""
-        provider = self.providers.get(self.default_provider)
+        provider_name = self.default_provider
+        provider = self.providers.get(provider_name)
         if not provider:
-            provider = self.providers["simulation"]
+            provider_name = "simulation"
+            provider = self.providers[provider_name]
+        
+        use_cache = use_cache and self.config.cache.enabled
+        cache_key = self._cache_key(provider_name, query, page, filters)
+        if use_cache:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                results, total = cached
+                return list(results), total
+        
+        # Single-flight: identical concurrent requests await the same upstream call
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._search_provider(provider, cache_key, query, page, filters, use_cache)
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        results, total = await asyncio.shield(task)
+        return list(results), total
+    
+    async def _search_provider(
+        self,
+        provider: SearchProvider,
+        cache_key: Tuple[str, str, int, bytes],
+        query: SearchQuery,
+        page: int,
+        filters: SearchFilter,
+        use_cache: bool
+    ) -> Tuple[List[RawResult], int]:
+        """Run the upstream search and fill the result cache"""
+        results, total = await provider.search(query, page, filters)
+        
+        # Empty responses are usually failures, so don't pin them in the cache
+        if use_cache and results:
+            self.result_cache.set(cache_key, (tuple(results), total))
         
-        return await provider.search(query, page, filters)
+        return results, total
+    
+    def _cache_key(self, provider_name: str, query: SearchQuery, page: int, filters: SearchFilter) -> Tuple[str, str, int, bytes]:
+        """Build the result cache key for a request"""
+        normalized_query = query.raw_query.strip().lower()
+        filters_key = serialization.dumps(filters.to_dict(), sort_keys=True, default=str)
+        return (provider_name, normalized_query, page, filters_key)
+    
+    def invalidate(self):
+        """Drop all cached provider results"""
+        self.result_cache.invalidate()
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get provider result cache statistics"""
+        return self.result_cache.stats()
     
     async def get_suggestions(self, partial_query: str) -> List[str]:
         """Get suggestions from default provider"""
@@ -376,9 +594,19 @@ class SearchProviderManager:
         
         return await provider.get_suggestions(partial_query)
     
+    async def close(self):
+        """Clean up provider resources"""
+        for provider in self.providers.values():
+            close = getattr(provider, "close", None)
+            if close:
+                await close()
+        if self._owns_client:
+            await self.http_client.close()
+    
     async def get_trending(self) -> List[str]:
         """Get trending searches"""
-        await asyncio.sleep(0.1)
+        if self.config.search.simulate_latency:
+            await asyncio.sleep(0.1)
         return [
             "Python programming",
             "Machine learning",
@@ -5,16 +5,35 @@ This module contains the core functionality of the search engine including
 the main engine, data models, filters, and history management.
 """
 
-from .engine import WebSearchEngine
-from .models import SearchResult, SearchFilter, SearchHistory
-from .filters import FilterManager
-from .history import HistoryManager
+from typing import TYPE_CHECKING
+
+from ..utils.helpers import lazy_exports
+
+if TYPE_CHECKING:
+    from .engine import WebSearchEngine
+    from .models import RawResult, SearchResult, SearchFilter, SearchHistory
+    from .filters import FilterManager
+    from .history import HistoryManager
+
+# Submodules are imported on first attribute access to keep startup fast
+_LAZY_EXPORTS = {
+    "WebSearchEngine": ".engine",
+    "RawResult": ".models",
+    "SearchResult": ".models",
+    "SearchFilter": ".models",
+    "SearchHistory": ".models",
+    "FilterManager": ".filters",
+    "HistoryManager": ".history",
+}
 
 __all__ = [
     "WebSearchEngine",
+    "RawResult",
     "SearchResult",
     "SearchFilter", 
     "SearchHistory",
     "FilterManager",
     "HistoryManager",
-] 
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
@@ -6,25 +6,65 @@ operations, result processing, and coordination with various search providers.
 """
 
 import asyncio
+import concurrent.futures
+import hashlib
+import heapq
+import threading
 import time
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import re
+import secrets
+from typing import List, Dict, Any, Callable, Coroutine, Iterator, Optional, Tuple, TypeVar
 from datetime import datetime
-import uuid
+from functools import lru_cache
+from io import StringIO
 
 from ..api.providers import SearchProviderManager
 from ..api.client import HTTPClient
 from ..utils.config import Config
-from ..utils.cache import CacheManager
+from ..utils.cache import CacheManager, LRUCache
+from ..utils import serialization
 from .models import (
-    SearchResult, SearchFilter, SearchHistory, SearchQuery,
+    RawResult, SearchResult, SearchFilter, SearchHistory, SearchQuery, SearchStats,
     ResultType, SafeSearchLevel
 )
 from .filters import FilterManager
 from .history import HistoryManager
+from .scoring import QueryMatcher
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Unknown provider types fall back to WEBPAGE, as in SearchResult
+_RESULT_TYPES = {result_type.value: result_type for result_type in ResultType}
+
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
+
+
+def _csv_field(value: str) -> str:
+    """Quote a CSV field when it contains a delimiter, quote or newline"""
+    if _CSV_SPECIAL.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+
+
+def _escape_non_ascii(match: "re.Match[str]") -> str:
+    """JSON escape for one non-ASCII character, as json.dumps(ensure_ascii=True) writes it"""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return '\\u{0:04x}\\u{1:04x}'.format(0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return '\\u{0:04x}'.format(code)
+
+T = TypeVar("T")
+
 
 class WebSearchEngine:
     """
@@ -42,12 +82,17 @@ class WebSearchEngine:
             config: Configuration object, loads default if None
         """
         self.config = config or Config.load()
-        self.session_id = str(uuid.uuid4())
+        self.session_id = secrets.token_hex(16)
         
         # Initialize managers
-        self.provider_manager = SearchProviderManager(self.config)
         self.http_client = HTTPClient(self.config)
+        self.provider_manager = SearchProviderManager(self.config, self.http_client)
         self.cache_manager = CacheManager(self.config)
+        # In-process result cache, only when caching is enabled in config
+        self._l1_cache: Optional[LRUCache] = (
+            LRUCache(max_size=1024, ttl=self.config.cache.search_ttl)
+            if self.config.cache.enabled else None
+        )
         self.filter_manager = FilterManager()
         self.history_manager = HistoryManager(self.config)
         
@@ -58,14 +103,20 @@ class WebSearchEngine:
         self.current_filters = SearchFilter()
         self.total_results = 0
         
+        # Background event loop for the synchronous API, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        
+        # In-flight fetches by cache key, shared by concurrent identical searches
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
         # Performance tracking
         self.last_search_time = 0.0
-        self.search_stats = {
-            "total_searches": 0,
-            "total_results": 0,
-            "average_time": 0.0,
-            "cache_hits": 0
-        }
+        self.search_stats = SearchStats()
+        # get_session_stats() result, rebuilt when the search state changes
+        self._session_stats: Optional[Dict[str, Any]] = None
+        self._stats_dirty = True
         
         logger.info(f"Search engine initialized with session ID: {self.session_id}")
     
@@ -74,7 +125,8 @@ class WebSearchEngine:
         query: str,
         page: int = 1,
         filters: Optional[SearchFilter] = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        status_cb: Optional[Callable[[str], None]] = None
     ) -> Tuple[List[SearchResult], int, float]:
         """
         Perform an asynchronous web search
@@ -84,45 +136,52 @@ class WebSearchEngine:
             page: Page number (1-based)
             filters: Search filters to apply
             use_cache: Whether to use cached results
-            
+            status_cb: Called with a short description of each stage reached
+        
         Returns:
             Tuple of (results, total_count, execution_time)
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        # Both cache levels are bypassed when caching is disabled in config
+        l1 = self._l1_cache if use_cache else None
+        use_cache = l1 is not None
         
         try:
+            # Apply filters
+            search_filters = filters or self.current_filters
+            
+            # In-process cache on the raw key, checked before parsing or hashing
+            l1_key = (query, page, search_filters.freeze())
+            if l1 is not None:
+                cached = l1.get(l1_key)
+                if cached is not None:
+                    self.search_stats.cache_hits += 1
+                    self._stats_dirty = True
+                    execution_time = time.monotonic() - start_time
+                    return cached[0], cached[1], execution_time
+            
             # Parse and validate query
             parsed_query = SearchQuery.parse(query)
             if not parsed_query.terms and not parsed_query.exact_phrases:
                 raise ValueError("Query must contain search terms")
             
-            # Apply filters
-            search_filters = filters or self.current_filters
-            
             # Check cache first
             cache_key = self._generate_cache_key(query, page, search_filters)
-            if use_cache:
+            if l1 is not None:
                 cached_results = await self.cache_manager.get(cache_key)
                 if cached_results:
-                    self.search_stats["cache_hits"] += 1
-                    execution_time = time.time() - start_time
+                    self.search_stats.cache_hits += 1
+                    self._stats_dirty = True
+                    l1.set(l1_key, (cached_results["results"], cached_results["total"]))
+                    execution_time = time.monotonic() - start_time
                     return cached_results["results"], cached_results["total"], execution_time
             
-            # Perform search using provider
-            results, total_count = await self.provider_manager.search(
-                parsed_query, page, search_filters
+            # Identical concurrent searches share a single fetch
+            processed_results, total_count = await self._fetch_single_flight(
+                cache_key, parsed_query, page, search_filters, use_cache, status_cb
             )
-            
-            # Process and enhance results
-            processed_results = await self._process_results(results, parsed_query)
-            
-            # Cache results
-            if use_cache:
-                await self.cache_manager.set(
-                    cache_key,
-                    {"results": processed_results, "total": total_count},
-                    ttl=self.config.cache.search_ttl
-                )
+            if l1 is not None:
+                l1.set(l1_key, (processed_results, total_count))
             
             # Update search state
             self.current_query = query
@@ -130,8 +189,9 @@ class WebSearchEngine:
             self.current_page = page
             self.current_filters = search_filters
             self.total_results = total_count
+            self._stats_dirty = True
             
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             self.last_search_time = execution_time
             
             # Update statistics
@@ -140,7 +200,6 @@ class WebSearchEngine:
             # Add to history
             history_entry = SearchHistory(
                 query=query,
-                timestamp=datetime.now(),
                 results_count=total_count,
                 filters=search_filters,
                 execution_time=execution_time,
@@ -155,18 +214,89 @@ class WebSearchEngine:
             )
             
             return processed_results, total_count, execution_time
-            
+        
         except Exception as e:
             logger.error(f"Search failed for query '{query}': {e}")
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             return [], 0, execution_time
     
+    async def _fetch_single_flight(
+        self,
+        cache_key: str,
+        parsed_query: SearchQuery,
+        page: int,
+        search_filters: SearchFilter,
+        use_cache: bool,
+        status_cb: Optional[Callable[[str], None]] = None
+    ) -> Tuple[List[SearchResult], int]:
+        """Run the fetch pipeline once per cache key, letting concurrent callers await it"""
+        loop = asyncio.get_running_loop()
+        if use_cache:
+            future = self._inflight.get(cache_key)
+            # Futures are bound to the loop that created them
+            if future is not None and future.get_loop() is loop:
+                return await asyncio.shield(future)
+        
+        future = loop.create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._fetch_and_process(
+                cache_key, parsed_query, page, search_filters, use_cache, status_cb
+            )
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so a failure nobody else awaited isn't logged
+                future.exception()
+            raise
+        finally:
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+    
+    async def _fetch_and_process(
+        self,
+        cache_key: str,
+        parsed_query: SearchQuery,
+        page: int,
+        search_filters: SearchFilter,
+        use_cache: bool,
+        status_cb: Optional[Callable[[str], None]] = None
+    ) -> Tuple[List[SearchResult], int]:
+        """Fetch results from the providers, score them and cache the outcome"""
+        if status_cb is not None:
+            status_cb("Querying search providers...")
+        
+        results, total_count = await self.provider_manager.search(
+            parsed_query, page, search_filters, use_cache
+        )
+        
+        if status_cb is not None:
+            status_cb(f"Ranking {len(results)} results...")
+        
+        # Process and enhance results
+        processed_results = await self._process_results(results, parsed_query)
+        
+        # Cache results
+        if use_cache:
+            await self.cache_manager.set(
+                cache_key,
+                {"results": processed_results, "total": total_count},
+                ttl=self.config.cache.search_ttl
+            )
+        
+        return processed_results, total_count
+    
     def search(
         self,
         query: str,
         page: int = 1,
         filters: Optional[SearchFilter] = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        status_cb: Optional[Callable[[str], None]] = None
     ) -> Tuple[List[SearchResult], int, float]:
         """
         Synchronous wrapper for search_async
@@ -176,30 +306,146 @@ class WebSearchEngine:
             page: Page number (1-based)
             filters: Search filters to apply
             use_cache: Whether to use cached results
-            
+            status_cb: Called with a short description of each stage reached,
+                from the engine's event loop thread
+        
         Returns:
             Tuple of (results, total_count, execution_time)
         """
         try:
-            # Try to get existing event loop
-            try:
-                loop = asyncio.get_running_loop()
-                # If there's a running loop, use ThreadPoolExecutor
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, self.search_async(query, page, filters, use_cache))
-                    return future.result()
-            except RuntimeError:
-                # No running loop, safe to use asyncio.run
-                return asyncio.run(self.search_async(query, page, filters, use_cache))
+            return self._run_sync(self.search_async(query, page, filters, use_cache, status_cb))
         except Exception as e:
             logger.error(f"Synchronous search failed: {e}")
             return [], 0, 0.0
     
+    def search_future(
+        self,
+        query: str,
+        page: int = 1,
+        filters: Optional[SearchFilter] = None,
+        use_cache: bool = True,
+        status_cb: Optional[Callable[[str], None]] = None
+    ) -> "concurrent.futures.Future[Tuple[List[SearchResult], int, float]]":
+        """
+        Start search_async on the engine's background loop without waiting
+        
+        Code running on another event loop can await the returned future
+        through asyncio.wrap_future() instead of blocking that loop in
+        search(). Arguments are those of search().
+        """
+        return self._submit(self.search_async(query, page, filters, use_cache, status_cb))
+    
+    def search_many(
+        self,
+        queries: List[str],
+        page: int = 1,
+        filters: Optional[SearchFilter] = None,
+        use_cache: bool = True
+    ) -> Iterator[Tuple[int, Tuple[List[SearchResult], int, float]]]:
+        """
+        Run several searches concurrently on the background loop
+        
+        At most config.search.max_concurrent_requests searches are in flight
+        at once. A failed search yields an empty result, as search() does.
+        
+        Args:
+            queries: Search query strings
+            page: Page number (1-based)
+            filters: Search filters to apply
+            use_cache: Whether to use cached results
+        
+        Yields:
+            (index into queries, search result tuple) in completion order
+        """
+        loop = self._get_background_loop()
+        semaphore = self._run_sync(self._new_semaphore(self.config.search.max_concurrent_requests))
+        futures = {
+            asyncio.run_coroutine_threadsafe(
+                self._search_limited(semaphore, query, page, filters, use_cache), loop
+            ): index
+            for index, query in enumerate(queries)
+        }
+        
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Search for {queries[futures[future]]!r} failed: {e}")
+                result = [], 0, 0.0
+            yield futures[future], result
+    
+    @staticmethod
+    async def _new_semaphore(limit: int) -> asyncio.Semaphore:
+        """Create a semaphore bound to the running loop (needed before 3.10)"""
+        return asyncio.Semaphore(max(1, limit))
+    
+    async def _search_limited(
+        self,
+        semaphore: asyncio.Semaphore,
+        query: str,
+        page: int,
+        filters: Optional[SearchFilter],
+        use_cache: bool
+    ) -> Tuple[List[SearchResult], int, float]:
+        """Run search_async once a concurrency slot is free"""
+        async with semaphore:
+            return await self.search_async(query, page, filters, use_cache)
+    
+    def _run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the engine's background event loop and wait for it
+        
+        One long-lived loop serves every synchronous call, so HTTP sessions
+        and in-flight requests persist between calls. The calling thread is
+        blocked until the coroutine finishes, including any event loop it is
+        running; such callers should await search_future() instead.
+        """
+        return self._submit(coro).result()
+    
+    def _submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the engine's background event loop"""
+        loop = self._get_background_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError("Synchronous engine calls cannot be made from the engine loop")
+        
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+    
+    def _get_background_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop thread on first use"""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name=f"searchengine-loop-{self.session_id[:8]}",
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+    
+    def _stop_background_loop(self):
+        """Stop the background event loop thread, if it was started"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+            loop.close()
+    
     async def _process_results(
         self,
-        raw_results: List[Dict[str, Any]],
-        query: SearchQuery
+        raw_results: List[RawResult],
+        query: SearchQuery,
+        limit: Optional[int] = None
     ) -> List[SearchResult]:
         """
         Process and enhance raw search results
@@ -207,93 +453,109 @@ class WebSearchEngine:
         Args:
             raw_results: Raw results from search provider
             query: Parsed search query
-            
+            limit: Keep only the best scoring results, all of them if None
+        
         Returns:
             List of processed SearchResult objects
         """
-        processed_results = []
+        # Lowercase and compile the query once rather than once per result
+        matcher = QueryMatcher(
+            [term.lower() for term in query.terms + query.required_terms],
+            [phrase.lower() for phrase in query.exact_phrases]
+        )
         
+        # Score from the raw fields first; SearchResult objects are only
+        # built for the results that are kept
+        kept: List[Tuple[RawResult, ResultType]] = []
         for i, raw_result in enumerate(raw_results):
-            try:
-                # Create SearchResult object
-                result = SearchResult(
-                    title=raw_result.get("title", ""),
-                    url=raw_result.get("url", ""),
-                    snippet=raw_result.get("snippet", ""),
-                    source=raw_result.get("source", ""),
-                    date=raw_result.get("date", ""),
-                    result_type=ResultType(raw_result.get("type", "webpage")),
-                    metadata=raw_result.get("metadata", {})
-                )
-                
-                # Calculate relevance score
-                relevance_score = self._calculate_relevance_score(result, query)
-                result.relevance_score = relevance_score
-                
-                processed_results.append(result)
-                
-            except Exception as e:
-                logger.warning(f"Failed to process result {i}: {e}")
+            # Same checks as SearchResult, done up front instead of via exceptions
+            title, url, snippet = raw_result.title, raw_result.url, raw_result.snippet
+            if (
+                not title or title.isspace()
+                or not url or url.isspace()
+                or not snippet or snippet.isspace()
+            ):
+                logger.warning(f"Skipping result {i}: title, URL and snippet are required")
                 continue
+            
+            kept.append((raw_result, _RESULT_TYPES.get(raw_result.type, ResultType.WEBPAGE)))
+        
+        # Term matching for all results in one pass
+        term_scores = matcher.score_many(
+            [raw_result.title.lower() for raw_result, _ in kept],
+            [raw_result.snippet.lower() for raw_result, _ in kept],
+            [raw_result.url.lower() for raw_result, _ in kept]
+        )
+        scores = [
+            self._calculate_relevance_score(
+                matcher, raw_result.title, raw_result.snippet, raw_result.url,
+                result_type, raw_result.date, term_score=term_score
+            )
+            for (raw_result, result_type), term_score in zip(kept, term_scores)
+        ]
         
-        # Sort by relevance score
-        processed_results.sort(key=lambda r: r.relevance_score, reverse=True)
+        # Sort by relevance score; both orderings keep ties in provider order
+        if limit is not None and limit < len(kept):
+            order = heapq.nlargest(limit, range(len(kept)), key=scores.__getitem__)
+        else:
+            order = sorted(range(len(kept)), key=scores.__getitem__, reverse=True)
+        
+        processed_results = []
+        for index in order:
+            raw_result, result_type = kept[index]
+            processed_results.append(SearchResult(
+                title=raw_result.title,
+                url=raw_result.url,
+                snippet=raw_result.snippet,
+                source=raw_result.source,
+                date=raw_result.date,
+                result_type=result_type,
+                relevance_score=scores[index]
+            ))
         
         return processed_results
     
     def _calculate_relevance_score(
         self,
-        result: SearchResult,
-        query: SearchQuery
+        matcher: QueryMatcher,
+        title: str,
+        snippet: str,
+        url: str,
+        result_type: ResultType,
+        date: str = "",
+        metadata: Optional[Dict[str, Any]] = None,
+        term_score: Optional[float] = None
     ) -> float:
         """
         Calculate relevance score for a search result
         
         Args:
-            result: Search result to score
-            query: Parsed search query
-            
+            matcher: Compiled terms of the parsed search query
+            title: Result title
+            snippet: Result snippet
+            url: Result URL
+            result_type: Result content type
+            date: Result publication date, if known
+            metadata: Extra result metadata, if any
+            term_score: Precomputed matcher score for the lowercased fields
+        
         Returns:
             Relevance score between 0.0 and 1.0
         """
-        score = 0.0
-        max_score = 0.0
-        
-        # Title matching (highest weight)
-        title_lower = result.title.lower()
-        for term in query.terms + query.required_terms:
-            max_score += 3.0
-            if term.lower() in title_lower:
-                score += 3.0
-        
-        # Exact phrase matching in title
-        for phrase in query.exact_phrases:
-            max_score += 5.0
-            if phrase.lower() in title_lower:
-                score += 5.0
-        
-        # Snippet matching (medium weight)
-        snippet_lower = result.snippet.lower()
-        for term in query.terms + query.required_terms:
-            max_score += 2.0
-            if term.lower() in snippet_lower:
-                score += 2.0
-        
-        # URL matching (low weight)
-        url_lower = result.url.lower()
-        for term in query.terms + query.required_terms:
-            max_score += 1.0
-            if term.lower() in url_lower:
-                score += 1.0
+        # Title, snippet and URL term matches plus exact phrases in the title
+        if term_score is None:
+            term_score = matcher.score(title.lower(), snippet.lower(), url.lower())
+        score = term_score
+        max_score = matcher.max_score
         
         # Domain authority bonus (if available)
-        if result.metadata.get("domain_authority"):
-            authority = float(result.metadata["domain_authority"]) / 100.0
+        if metadata and metadata.get("domain_authority"):
+            authority = float(metadata["domain_authority"]) / 100.0
             score += authority * 2.0
             max_score += 2.0
         
         # Recency bonus for news results
-        if result.result_type == ResultType.NEWS and result.date:
+        if result_type == ResultType.NEWS and date:
             try:
                 # Parse date and give bonus for recent results
                 # Implementation would depend on date format
@@ -315,22 +577,33 @@ class WebSearchEngine:
         filters: SearchFilter
     ) -> str:
         """Generate cache key for search results"""
-        import hashlib
+        # Sorted JSON keeps the filters part stable regardless of dict ordering
+        filters_data = serialization.dumps(filters.to_dict(), sort_keys=True, default=str)
+        return self._digest_cache_key(query, page, filters_data)
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _digest_cache_key(query: str, page: int, filters_data: bytes) -> str:
+        """Hash the query, page and serialized filters into a cache key"""
+        key_data = b"|".join((query.encode(), str(page).encode(), filters_data))
         
-        # Create a unique key based on query, page, and filters
-        key_data = f"{query}|{page}|{filters.to_dict()}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        # Not security sensitive, so a fast non-cryptographic hash is fine
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_hexdigest(key_data)
+        return hashlib.blake2b(key_data, digest_size=16).hexdigest()
     
     def _update_search_stats(self, result_count: int, execution_time: float):
         """Update search statistics"""
-        self.search_stats["total_searches"] += 1
-        self.search_stats["total_results"] += result_count
-        
-        # Update average time
-        total_searches = self.search_stats["total_searches"]
-        current_avg = self.search_stats["average_time"]
-        new_avg = ((current_avg * (total_searches - 1)) + execution_time) / total_searches
-        self.search_stats["average_time"] = new_avg
+        self.search_stats.total_searches += 1
+        self.search_stats.total_results += result_count
+        # The average is derived from the running total when read
+        self.search_stats.total_time += execution_time
+        self._stats_dirty = True
+    
+    @property
+    def average_search_time(self) -> float:
+        """Mean execution time of completed searches"""
+        return self.search_stats.total_time / max(1, self.search_stats.total_searches)
     
     async def next_page(self) -> Tuple[List[SearchResult], int, float]:
         """Get next page of current search results"""
@@ -375,24 +648,35 @@ class WebSearchEngine:
         return self.current_query
     
     def get_session_stats(self) -> Dict[str, Any]:
-        """Get session statistics for the enhanced console interface"""
-        return {
-            "total_searches": self.search_stats["total_searches"],
-            "total_results": self.search_stats["total_results"], 
-            "avg_search_time": self.search_stats["average_time"],
-            "success_rate": 100.0 if self.search_stats["total_searches"] == 0 else 
-                           (self.search_stats["total_searches"] / max(1, self.search_stats["total_searches"])) * 100,
-            "cache_hits": self.search_stats["cache_hits"],
+        """
+        Get session statistics for the enhanced console interface
+        
+        The dictionary is rebuilt only after the search state changes, so
+        callers must not modify it.
+        """
+        if not self._stats_dirty and self._session_stats is not None:
+            return self._session_stats
+        
+        self._stats_dirty = False
+        self._session_stats = {
+            "total_searches": self.search_stats.total_searches,
+            "total_results": self.search_stats.total_results, 
+            "avg_search_time": self.average_search_time,
+            "success_rate": 100.0 if self.search_stats.total_searches == 0 else 
+                           (self.search_stats.total_searches / max(1, self.search_stats.total_searches)) * 100,
+            "cache_hits": self.search_stats.cache_hits,
             "provider": self.config.api.default_provider,
             "session_id": self.session_id,
             "current_page": self.current_page,
             "total_pages": self.total_pages
         }
+        return self._session_stats
     
     def apply_filters(self, filters: SearchFilter):
         """Apply new search filters"""
         self.current_filters = filters
         self.filter_manager.apply_filters(filters)
+        self._stats_dirty = True
     
     def get_search_history(self, limit: int = 50) -> List[SearchHistory]:
         """Get recent search history"""
@@ -405,7 +689,8 @@ class WebSearchEngine:
     def get_search_stats(self) -> Dict[str, Any]:
         """Get search engine statistics"""
         return {
-            **self.search_stats,
+            **self.search_stats.to_dict(),
+            "average_time": self.average_search_time,
             "session_id": self.session_id,
             "current_query": self.current_query,
             "current_page": self.current_page,
@@ -442,100 +727,151 @@ class WebSearchEngine:
         Args:
             format_type: Export format ('json', 'csv', 'txt')
             include_metadata: Whether to include metadata
-            
+        
         Returns:
             Formatted string of results
         """
+        return "".join(self.iter_export(format_type, include_metadata))
+    
+    def iter_export(
+        self,
+        format_type: str = "json",
+        include_metadata: bool = True
+    ) -> Iterator[str]:
+        """
+        Export current search results as a stream of text chunks
+        
+        The chunks join into the same text as export_results, but only one
+        result is formatted at a time so large exports can be written out
+        as they are produced.
+        
+        Args:
+            format_type: Export format ('json', 'csv', 'txt')
+            include_metadata: Whether to include metadata
+        
+        Returns:
+            Iterator of text chunks
+        """
         if not self.current_results:
-            return ""
-        
-        if format_type.lower() == "json":
-            import json
-            data = {
-                "query": self.current_query,
-                "page": self.current_page,
-                "total_results": self.total_results,
-                "execution_time": self.last_search_time,
-                "results": [r.to_dict() for r in self.current_results]
-            }
+            return iter(())
+        
+        exporters = {
+            "json": self._iter_json_export,
+            "csv": self._iter_csv_export,
+            "txt": self._iter_txt_export,
+        }
+        # Checked eagerly so a bad format fails here rather than on first read
+        exporter = exporters.get(format_type.lower())
+        if exporter is None:
+            raise ValueError(f"Unsupported export format: {format_type}")
+        return exporter(include_metadata)
+    
+    def _iter_json_export(self, include_metadata: bool) -> Iterator[str]:
+        """Yield the JSON export one result at a time, pretty-printed"""
+        def encode(value: Any, level: int) -> str:
+            # Nested values are re-indented to their depth in the document
+            text = serialization.dumps(value, default=str, indent=True).decode('utf-8')
+            if not text.isascii():
+                # The export format has always escaped non-ASCII characters
+                text = _NON_ASCII.sub(_escape_non_ascii, text)
+            return text.replace("\n", "\n" + " " * level)
+        
+        head = {
+            "query": self.current_query,
+            "page": self.current_page,
+            "total_results": self.total_results,
+            "execution_time": self.last_search_time
+        }
+        tail: Dict[str, Any] = {}
+        if include_metadata:
+            tail["filters"] = self.current_filters.to_dict()
+            tail["session_id"] = self.session_id
+            tail["timestamp"] = datetime.now().isoformat()
+        
+        yield "{\n"
+        for key, value in head.items():
+            yield f'  "{key}": {encode(value, 2)},\n'
+        
+        yield '  "results": ['
+        for i, result in enumerate(self.current_results):
+            yield ("\n    " if i == 0 else ",\n    ") + encode(result.to_dict(), 4)
+        yield "\n  ]"
+        
+        for key, value in tail.items():
+            yield f',\n  "{key}": {encode(value, 2)}'
+        yield "\n}"
+    
+    def _iter_csv_export(self, include_metadata: bool) -> Iterator[str]:
+        """Yield the CSV export one row at a time"""
+        # Rows are joined directly rather than through csv.writer; quoting
+        # and line endings match its default (excel) dialect
+        headers = ["Title", "URL", "Snippet", "Source", "Date", "Type"]
+        if include_metadata:
+            headers.extend(["Relevance Score", "Metadata"])
+        yield ",".join(headers) + "\r\n"
+        
+        for result in self.current_results:
+            fields = [
+                result.title,
+                result.url,
+                result.snippet,
+                result.source,
+                result.date,
+                result.result_type.value
+            ]
             if include_metadata:
-                data["filters"] = self.current_filters.to_dict()
-                data["session_id"] = self.session_id
-                data["timestamp"] = datetime.now().isoformat()
-            
-            return json.dumps(data, indent=2)
+                fields.extend([
+                    str(result.relevance_score),
+                    str(result.metadata)
+                ])
+            yield ",".join(map(_csv_field, fields)) + "\r\n"
+    
+    def _iter_txt_export(self, include_metadata: bool) -> Iterator[str]:
+        """Yield the text export one result block at a time"""
+        buf = StringIO()
+        w = buf.write
+        w(f"Search Query: {self.current_query}\n")
+        w(f"Page: {self.current_page}\n")
+        w(f"Total Results: {self.total_results}\n")
+        w(f"Execution Time: {self.last_search_time:.2f}s\n")
+        w(f"Session ID: {self.session_id}\n")
+        w(f"Timestamp: {datetime.now().isoformat()}\n")
+        w("\n")
+        w("=" * 80)
+        w("\n\n")
+        yield buf.getvalue()
         
-        elif format_type.lower() == "csv":
-            import csv
-            from io import StringIO
+        for i, result in enumerate(self.current_results, 1):
+            buf = StringIO()
+            w = buf.write
+            # Results are separated by a blank line
+            if i > 1:
+                w("\n")
+            w(f"{i}. {result.title}\n")
+            w(f"   URL: {result.url}\n")
+            w(f"   Source: {result.source}\n")
+            w(f"   Date: {result.date}\n")
+            w(f"   Type: {result.result_type.value}\n")
+            w(f"   Snippet: {result.snippet}\n")
             
-            output = StringIO()
-            writer = csv.writer(output)
+            if include_metadata and result.metadata:
+                w(f"   Metadata: {result.metadata}\n")
             
-            # Header
-            headers = ["Title", "URL", "Snippet", "Source", "Date", "Type"]
             if include_metadata:
-                headers.extend(["Relevance Score", "Metadata"])
-            writer.writerow(headers)
-            
-            # Data
-            for result in self.current_results:
-                row = [
-                    result.title,
-                    result.url,
-                    result.snippet,
-                    result.source,
-                    result.date,
-                    result.result_type.value
-                ]
-                if include_metadata:
-                    row.extend([
-                        result.relevance_score,
-                        str(result.metadata)
-                    ])
-                writer.writerow(row)
-            
-            return output.getvalue()
-        
-        elif format_type.lower() == "txt":
-            lines = [
-                f"Search Query: {self.current_query}",
-                f"Page: {self.current_page}",
-                f"Total Results: {self.total_results}",
-                f"Execution Time: {self.last_search_time:.2f}s",
-                f"Session ID: {self.session_id}",
-                f"Timestamp: {datetime.now().isoformat()}",
-                "",
-                "=" * 80,
-                ""
-            ]
-            
-            for i, result in enumerate(self.current_results, 1):
-                lines.extend([
-                    f"{i}. {result.title}",
-                    f"   URL: {result.url}",
-                    f"   Source: {result.source}",
-                    f"   Date: {result.date}",
-                    f"   Type: {result.result_type.value}",
-                    f"   Snippet: {result.snippet}",
-                ])
-                
-                if include_metadata and result.metadata:
-                    lines.append(f"   Metadata: {result.metadata}")
-                
-                if include_metadata:
-                    lines.append(f"   Relevance: {result.relevance_score:.3f}")
-                
-                lines.append("")
-            
-            return "\n".join(lines)
-        
-        else:
-            raise ValueError(f"Unsupported export format: {format_type}")
+                w(f"   Relevance: {result.relevance_score:.3f}\n")
+            yield buf.getvalue()
     
     async def close(self):
         """Clean up resources"""
+        await self.provider_manager.close()
         await self.http_client.close()
         await self.cache_manager.close()
         await self.history_manager.close()
-        logger.info("Search engine closed") 
\ No newline at end of file
+        logger.info("Search engine closed")
+    
+    def shutdown(self):
+        """Synchronously close the engine and stop its background event loop"""
+        if self._loop is not None and self._loop.is_running():
+            # Resources were created on the background loop, so close them there
+            self._run_sync(self.close())
+        self._stop_background_loop()
\ No newline at end of file
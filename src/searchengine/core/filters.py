@@ -5,14 +5,59 @@ This module handles search filtering logic including filter validation,
 application, and management of filter states.
 """
 
-from typing import Dict, List, Any, Optional
+import copy
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Mapping, Optional
 from datetime import datetime, timedelta
 import logging
+import time
 
 from .models import SearchFilter, SafeSearchLevel
 
 logger = logging.getLogger(__name__)
 
+_VALID_DATE_RANGES = frozenset({"any", "day", "week", "month", "year", "custom"})
+_VALID_CONTENT_TYPES = frozenset({"any", "webpage", "image", "video", "news", "pdf", "doc"})
+
+
+_DATE_RANGE_DELTAS = {
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+
+
+# Query parameter (name, value) sent for each content type
+_CONTENT_TYPE_PARAMS = {
+    "pdf": ("filetype", "pdf"),
+    "doc": ("filetype", "doc"),
+    "image": ("type", "image"),
+    "video": ("type", "video"),
+    "news": ("type", "news"),
+}
+
+
+@lru_cache(maxsize=16)
+def _cutoff_cached(date_range: str, minute_bucket: int) -> datetime:
+    """Cutoff for a date range, measured from the start of the given minute"""
+    delta = _DATE_RANGE_DELTAS.get(date_range)
+    if delta is None:
+        return datetime.min  # No cutoff for unknown ranges
+    return datetime.fromtimestamp(minute_bucket * 60) - delta
+
+
+def _is_iso_timestamp(value: str) -> bool:
+    """Whether value is a YYYY-MM-DDTHH:MM:SS[.ffffff] timestamp without a UTC offset"""
+    return (
+        len(value) >= 19
+        and value[10] == "T" and value[13] == ":" and value[16] == ":"
+        and value[4] == "-" and value[7] == "-"
+        and value[:4].isdigit() and value[5:7].isdigit() and value[8:10].isdigit()
+        and "+" not in value and not value.endswith("Z") and value.count("-") == 2
+    )
+
 
 class FilterManager:
     """
@@ -26,20 +71,16 @@ class FilterManager:
     def __init__(self):
         """Initialize the filter manager"""
         self.active_filters = SearchFilter()
-        self.filter_presets = self._create_default_presets()
-        
-    def _create_default_presets(self) -> Dict[str, SearchFilter]:
-        """Create default filter presets"""
-        return {
-            "default": SearchFilter(),
-            "recent": SearchFilter(date_range="week"),
-            "images": SearchFilter(content_type="image"),
-            "news": SearchFilter(content_type="news", date_range="week"),
-            "pdfs": SearchFilter(content_type="pdf"),
-            "academic": SearchFilter(content_type="any", custom_filters={"academic": True}),
-            "safe": SearchFilter(safe_search=SafeSearchLevel.STRICT),
-            "local": SearchFilter(region="us", language="en")
-        }
+        # This manager's own presets, copied from the shared defaults on the
+        # first add_preset_filter
+        self._custom_presets: Optional[Dict[str, SearchFilter]] = None
+    
+    @property
+    def filter_presets(self) -> Mapping[str, SearchFilter]:
+        """Available presets by name"""
+        if self._custom_presets is None:
+            return _DEFAULT_PRESETS
+        return self._custom_presets
     
     def apply_filters(self, filters: SearchFilter) -> bool:
         """
@@ -47,45 +88,45 @@ class FilterManager:
         
         Args:
             filters: SearchFilter object to apply
-            
+        
         Returns:
             True if filters were applied successfully
         """
         try:
-            # Validate filters
-            self.validate_filters(filters)
+            # Validate filters, unless already done since their last change
+            if not filters._validated:
+                self.validate_filters(filters)
             
             # Apply filters
             self.active_filters = filters
             
             logger.info(f"Applied filters: {filters.to_dict()}")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to apply filters: {e}")
             return False
     
-    def validate_filters(self, filters: SearchFilter) -> bool:
+    @staticmethod
+    def validate_filters(filters: SearchFilter) -> bool:
         """
         Validate filter values
         
         Args:
             filters: SearchFilter object to validate
-            
+        
         Returns:
             True if filters are valid
-            
+        
         Raises:
             ValueError: If filters are invalid
         """
         # Date range validation
-        valid_date_ranges = ["any", "day", "week", "month", "year", "custom"]
-        if filters.date_range not in valid_date_ranges:
+        if filters.date_range not in _VALID_DATE_RANGES:
             raise ValueError(f"Invalid date range: {filters.date_range}")
         
         # Content type validation
-        valid_content_types = ["any", "webpage", "image", "video", "news", "pdf", "doc"]
-        if filters.content_type not in valid_content_types:
+        if filters.content_type not in _VALID_CONTENT_TYPES:
             raise ValueError(f"Invalid content type: {filters.content_type}")
         
         # Language validation (basic check)
@@ -96,6 +137,7 @@ class FilterManager:
         if filters.region != "any" and len(filters.region) != 2:
             raise ValueError(f"Invalid region code: {filters.region}")
         
+        filters._validated = True
         return True
     
     def get_filter_query_params(self, filters: SearchFilter) -> Dict[str, Any]:
@@ -104,37 +146,21 @@ class FilterManager:
         
         Args:
             filters: SearchFilter object
-            
+        
         Returns:
             Dictionary of query parameters
         """
         params = {}
         
         # Date range handling
-        if filters.date_range != "any":
-            date_mapping = {
-                "day": timedelta(days=1),
-                "week": timedelta(weeks=1),
-                "month": timedelta(days=30),
-                "year": timedelta(days=365)
-            }
-            
-            if filters.date_range in date_mapping:
-                since_date = datetime.now() - date_mapping[filters.date_range]
-                params["since"] = since_date.isoformat()
+        delta = _DATE_RANGE_DELTAS.get(filters.date_range)
+        if delta is not None:
+            params["since"] = (datetime.now() - delta).isoformat()
         
         # Content type handling
-        if filters.content_type != "any":
-            if filters.content_type == "pdf":
-                params["filetype"] = "pdf"
-            elif filters.content_type == "doc":
-                params["filetype"] = "doc"
-            elif filters.content_type == "image":
-                params["type"] = "image"
-            elif filters.content_type == "video":
-                params["type"] = "video"
-            elif filters.content_type == "news":
-                params["type"] = "news"
+        content_param = _CONTENT_TYPE_PARAMS.get(filters.content_type)
+        if content_param is not None:
+            params[content_param[0]] = content_param[1]
         
         # Language handling
         if filters.language != "any":
@@ -145,7 +171,7 @@ class FilterManager:
             params["region"] = filters.region
         
         # Safe search handling
-        if filters.safe_search != SafeSearchLevel.MODERATE:
+        if filters.safe_search is not SafeSearchLevel.MODERATE:
             params["safe"] = filters.safe_search.value
         
         # Custom filters
@@ -159,7 +185,7 @@ class FilterManager:
         
         Args:
             **kwargs: Filter parameters
-            
+        
         Returns:
             SearchFilter object
         """
@@ -178,11 +204,20 @@ class FilterManager:
         
         Args:
             preset_name: Name of the preset
-            
+        
         Returns:
-            SearchFilter object or None if preset not found
+            Copy of the preset SearchFilter, or None if preset not found
         """
-        return self.filter_presets.get(preset_name)
+        preset = self.filter_presets.get(preset_name)
+        if preset is None:
+            return None
+        # Presets are shared, so callers get a copy they are free to modify.
+        # custom_filters is set directly so the copy keeps its validation
+        # mark; only the cached dict, which holds the old mapping, is dropped
+        filters = copy.copy(preset)
+        object.__setattr__(filters, "custom_filters", dict(preset.custom_filters))
+        object.__setattr__(filters, "_dict_cache", None)
+        return filters
     
     def add_preset_filter(self, name: str, filters: SearchFilter):
         """
@@ -192,7 +227,9 @@ class FilterManager:
             name: Name for the preset
             filters: SearchFilter object
         """
-        self.filter_presets[name] = filters
+        if self._custom_presets is None:
+            self._custom_presets = dict(_DEFAULT_PRESETS)
+        self._custom_presets[name] = filters
         logger.info(f"Added filter preset: {name}")
     
     def list_preset_filters(self) -> List[str]:
@@ -264,23 +301,41 @@ class FilterManager:
         """
         Merge two filter objects, with override taking precedence
         
+        When one side has no active filters the other is returned as is, and
+        custom filters are only copied when both sides have some, so the
+        result may share state with the inputs and must not be modified.
+        
         Args:
             base_filters: Base filter settings
             override_filters: Override filter settings
-            
+        
         Returns:
             Merged SearchFilter object
         """
-        merged_custom = {**base_filters.custom_filters, **override_filters.custom_filters}
+        if not override_filters.is_active():
+            return base_filters
+        if not base_filters.is_active():
+            return override_filters
+        
+        if not override_filters.custom_filters:
+            merged_custom = base_filters.custom_filters
+        elif not base_filters.custom_filters:
+            merged_custom = override_filters.custom_filters
+        else:
+            merged_custom = {**base_filters.custom_filters, **override_filters.custom_filters}
         
-        return SearchFilter(
+        merged = SearchFilter(
             date_range=override_filters.date_range if override_filters.date_range != "any" else base_filters.date_range,
             content_type=override_filters.content_type if override_filters.content_type != "any" else base_filters.content_type,
             language=override_filters.language if override_filters.language != "any" else base_filters.language,
             region=override_filters.region if override_filters.region != "any" else base_filters.region,
-            safe_search=override_filters.safe_search if override_filters.safe_search != SafeSearchLevel.MODERATE else base_filters.safe_search,
+            safe_search=override_filters.safe_search if override_filters.safe_search is not SafeSearchLevel.MODERATE else base_filters.safe_search,
             custom_filters=merged_custom
         )
+        # Every field comes from one of the inputs, so valid inputs give a valid merge
+        if base_filters._validated and override_filters._validated:
+            merged._validated = True
+        return merged
     
     def filter_results_post_search(self, results: List[Dict[str, Any]], filters: SearchFilter) -> List[Dict[str, Any]]:
         """
@@ -289,56 +344,78 @@ class FilterManager:
         Args:
             results: List of search result dictionaries
             filters: Filters to apply
-            
+        
         Returns:
             Filtered list of results
         """
         if not filters.is_active():
             return results
         
-        filtered_results = []
-        
-        for result in results:
-            # Apply custom filtering logic
-            if self._result_matches_filters(result, filters):
-                filtered_results.append(result)
-        
-        return filtered_results
+        # One comprehension per active check, cheapest first, so later checks
+        # only see the survivors and no per-result all() generator is built
+        filtered = list(results)
+        for check in self._compile(filters):
+            if not filtered:
+                break
+            filtered = [result for result in filtered if check(result)]
+        return filtered
     
-    def _result_matches_filters(self, result: Dict[str, Any], filters: SearchFilter) -> bool:
+    def _compile(self, filters: SearchFilter) -> List[Callable[[Dict[str, Any]], bool]]:
         """
-        Check if a single result matches the given filters
+        Build the predicates that check a result against the given filters
+        
+        The filters are inspected once; only the active checks are returned,
+        with their values captured as locals.
         
         Args:
-            result: Search result dictionary
             filters: Filters to check against
-            
+        
         Returns:
-            True if result matches filters
+            Functions each returning True if a result dictionary passes that check
         """
+        checks: List[Callable[[Dict[str, Any]], bool]] = []
+        
         # Check content type
         if filters.content_type != "any":
-            result_type = result.get("type", "webpage")
-            if filters.content_type != result_type:
-                return False
+            content_type = filters.content_type
+            checks.append(lambda result: result.get("type", "webpage") == content_type)
         
         # Check date range (if date is available)
-        if filters.date_range != "any" and result.get("date"):
-            try:
-                result_date = datetime.fromisoformat(result["date"])
-                cutoff_date = self._get_date_cutoff(filters.date_range)
-                if result_date < cutoff_date:
-                    return False
-            except (ValueError, TypeError):
-                pass  # Skip date filtering if date parsing fails
+        if filters.date_range != "any":
+            cutoff_date = self._get_date_cutoff(filters.date_range)
+            cutoff_iso = cutoff_date.isoformat()
+            
+            def matches_date(result: Dict[str, Any]) -> bool:
+                date = result.get("date")
+                if not date:
+                    return True
+                # Full ISO-8601 timestamps in local time sort as strings, so they
+                # are compared without building a datetime; shorter forms such
+                # as a bare date would sort before an equal cutoff
+                if isinstance(date, str) and _is_iso_timestamp(date):
+                    return date >= cutoff_iso
+                try:
+                    return datetime.fromisoformat(date) >= cutoff_date
+                except (ValueError, TypeError):
+                    return True  # Skip date filtering if date parsing fails
+            
+            checks.append(matches_date)
         
         # Check custom filters
-        for key, value in filters.custom_filters.items():
-            if key in result:
-                if result[key] != value:
-                    return False
+        if filters.custom_filters:
+            custom_items = tuple(filters.custom_filters.items())
+            missing = object()
+            
+            def matches_custom(result: Dict[str, Any]) -> bool:
+                for key, value in custom_items:
+                    found = result.get(key, missing)
+                    if found is not missing and found != value:
+                        return False
+                return True
+            
+            checks.append(matches_custom)
         
-        return True
+        return checks
     
     def _get_date_cutoff(self, date_range: str) -> datetime:
         """
@@ -346,19 +423,28 @@ class FilterManager:
         
         Args:
             date_range: Date range string
-            
+        
         Returns:
             Cutoff datetime
         """
-        now = datetime.now()
-        
-        if date_range == "day":
-            return now - timedelta(days=1)
-        elif date_range == "week":
-            return now - timedelta(weeks=1)
-        elif date_range == "month":
-            return now - timedelta(days=30)
-        elif date_range == "year":
-            return now - timedelta(days=365)
-        else:
-            return datetime.min  # No cutoff for unknown ranges 
\ No newline at end of file
+        return _cutoff_cached(date_range, int(time.time()) // 60)
+
+
+def _create_default_presets() -> Dict[str, SearchFilter]:
+    """Create default filter presets, validated once up front"""
+    presets = {
+        "default": SearchFilter(),
+        "recent": SearchFilter(date_range="week"),
+        "images": SearchFilter(content_type="image"),
+        "news": SearchFilter(content_type="news", date_range="week"),
+        "pdfs": SearchFilter(content_type="pdf"),
+        "academic": SearchFilter(content_type="any", custom_filters={"academic": True}),
+        "safe": SearchFilter(safe_search=SafeSearchLevel.STRICT),
+        "local": SearchFilter(region="us", language="en")
+    }
+    for preset in presets.values():
+        FilterManager.validate_filters(preset)
+    return presets
+
+
+_DEFAULT_PRESETS: Mapping[str, SearchFilter] = MappingProxyType(_create_default_presets())
@@ -4,29 +4,62 @@ SearchEngine Pro - History Manager
 This module handles search history tracking, storage, and retrieval.
 """
 
-import json
+import asyncio
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import List, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Optional
 from datetime import datetime
 
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 from ..utils.config import Config
+from ..utils import serialization
 from .models import SearchHistory
 
 logger = logging.getLogger(__name__)
 
+# msgspec builds the dataclasses straight from JSON, skipping from_dict
+_HISTORY_DECODER = msgspec.json.Decoder(List[SearchHistory]) if MSGSPEC_AVAILABLE else None
+
+# Seconds new entries are buffered before being written in the background
+_FLUSH_DELAY = 0.5
+
 
 class HistoryManager:
     """
     Manages search history storage and retrieval
+    
+    History is stored as JSON Lines: new entries are appended, and the file
+    is only rewritten when it has grown to twice max_entries. Appends are
+    debounced and run in a worker thread so searches never wait on disk.
     """
     
     def __init__(self, config: Config):
         """Initialize history manager"""
         self.config = config
-        self.history: List[SearchHistory] = []
-        self.history_file = Path(config.data_dir) / "search_history.json"
         self.max_entries = getattr(config.history, 'max_entries', 1000)
+        # Oldest entries are evicted automatically once max_entries is reached
+        self.history: Deque[SearchHistory] = deque(maxlen=self.max_entries)
+        self.history_file = Path(config.data_dir) / "search_history.jsonl"
+        # Single JSON array written by earlier versions, migrated on load
+        self._legacy_file = Path(config.data_dir) / "search_history.json"
+        
+        # Encoded entries not yet appended, and lines currently in the file
+        self._pending: List[bytes] = []
+        self._file_entries = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        # File writes may run in a worker thread; every rewrite bumps the
+        # generation so appends already covered by it are dropped
+        self._write_lock = threading.Lock()
+        self._generation = 0
         
         # Create data directory if it doesn't exist
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
@@ -38,42 +71,145 @@ class HistoryManager:
         """Load history from file"""
         try:
             if self.history_file.exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.history = [SearchHistory.from_dict(item) for item in data]
+                with open(self.history_file, 'rb') as f:
+                    data = f.read()
+                lines = [line for line in data.splitlines() if line.strip()]
+                self._file_entries = len(lines)
+                self.history.extend(self._decode_lines(lines)[-self.max_entries:])
+                if data and not data.endswith(b"\n"):
+                    # Rewrite so new appends don't extend a truncated line
+                    self._save_history()
                 logger.info(f"Loaded {len(self.history)} history entries")
+            elif self._legacy_file.exists():
+                data = serialization.loads(self._legacy_file.read_bytes())
+                self.history.extend(SearchHistory.from_dict(item) for item in data)
+                self._save_history()
+                logger.info(f"Migrated {len(self.history)} history entries to {self.history_file.name}")
         except Exception as e:
             logger.warning(f"Failed to load history: {e}")
-            self.history = []
+            self.history.clear()
     
-    def _save_history(self):
-        """Save history to file"""
+    def _decode_lines(self, lines: List[bytes]) -> List[SearchHistory]:
+        """Decode JSON lines, in a single parser call when they are all intact"""
+        data = b"[" + b",".join(lines) + b"]"
+        if _HISTORY_DECODER is not None:
+            try:
+                return _HISTORY_DECODER.decode(data)
+            except msgspec.MsgspecError:
+                pass
+        try:
+            return [SearchHistory.from_dict(item) for item in serialization.loads(data)]
+        except ValueError:
+            pass
+        
+        items = []
+        for line in lines:
+            try:
+                items.append(SearchHistory.from_dict(serialization.loads(line)))
+            except ValueError as e:
+                # A crash mid-append can leave a truncated last line
+                logger.debug(f"Skipping unreadable history line: {e}")
+        return items
+    
+    def _encode(self, entry: SearchHistory) -> bytes:
+        """Encode one entry as a JSON line"""
+        return serialization.dumps(entry.to_dict(), default=str) + b"\n"
+    
+    def _append(self, batch: List[bytes], generation: int) -> bool:
+        """Append encoded entries unless a rewrite has already included them"""
+        try:
+            with self._write_lock:
+                if generation == self._generation:
+                    with open(self.history_file, 'ab') as f:
+                        f.write(b"".join(batch))
+                    self._file_entries += len(batch)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save history: {e}")
+            return False
+    
+    def _rewrite(self, entries: List[SearchHistory], generation: int):
+        """Replace the history file with the given entries"""
         try:
-            data = [entry.to_dict() for entry in self.history]
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            data = b"".join(self._encode(entry) for entry in entries)
+            with self._write_lock:
+                if generation != self._generation:
+                    return  # A newer rewrite already happened
+                temp_file = self.history_file.with_suffix(".jsonl.tmp")
+                with open(temp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_file, self.history_file)
+                self._file_entries = len(entries)
+                self._generation += 1
         except Exception as e:
             logger.error(f"Failed to save history: {e}")
     
+    def _flush(self):
+        """Append buffered entries to the history file"""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        if not self._append(batch, self._generation):
+            self._pending[:0] = batch
+            return
+        
+        # Compact once pruned entries make up half the file
+        if self._file_entries >= 2 * self.max_entries:
+            self._save_history()
+    
+    async def _flush_later(self):
+        """Write buffered entries after a short delay, off the event loop"""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                await asyncio.sleep(_FLUSH_DELAY)
+                batch, self._pending = self._pending, []
+                written = await loop.run_in_executor(None, self._append, batch, self._generation)
+                if not written:
+                    self._pending[:0] = batch
+                    break
+                if self._file_entries >= 2 * self.max_entries:
+                    await loop.run_in_executor(
+                        None, self._rewrite, list(self.history), self._generation
+                    )
+        finally:
+            self._flush_task = None
+    
+    def _save_history(self):
+        """Rewrite the history file with the current entries"""
+        self._pending = []
+        self._rewrite(list(self.history), self._generation)
+    
     async def add_entry(self, entry: SearchHistory):
         """Add a new search history entry"""
+        if entry.timestamp is None:
+            entry.timestamp = datetime.now()
         self.history.append(entry)
         
-        # Limit history size
-        if len(self.history) > self.max_entries:
-            self.history = self.history[-self.max_entries:]
-        
-        self._save_history()
+        self._pending.append(self._encode(entry))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
     
     def get_history(self, limit: int = 50) -> List[SearchHistory]:
         """Get recent search history"""
-        return self.history[-limit:]
+        if limit <= 0 or limit >= len(self.history):
+            return list(self.history)
+        # Walk back from the newest end rather than copying the whole deque
+        recent = list(islice(reversed(self.history), limit))
+        recent.reverse()
+        return recent
     
     def clear_history(self):
         """Clear all search history"""
-        self.history = []
+        self.history.clear()
         self._save_history()
     
     async def close(self):
         """Cleanup resources"""
-        self._save_history() 
\ No newline at end of file
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush()
\ No newline at end of file
@@ -6,11 +6,30 @@ including search results, filters, and history entries.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, NamedTuple, Optional, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 
+# __slots__ cuts per-instance memory for models allocated in bulk
+from ..utils.helpers import DATACLASS_SLOTS
+
+# Accepted SearchFilter values, and its attributes derived from the fields
+_FILTER_DATE_RANGES = frozenset({"any", "day", "week", "month", "year"})
+_FILTER_CONTENT_TYPES = frozenset({"any", "pdf", "doc", "image", "video", "news"})
+_FILTER_DERIVED_STATE = frozenset({"_dict_cache", "_frozen_cache", "_active", "_validated"})
+
+
+def _freeze_value(value: Any) -> Any:
+    """Recursively convert dicts, lists and sets into hashable equivalents"""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze_value(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze_value(v) for v in value)
+    return value
+
 
 class ResultType(Enum):
     """Enumeration of different result types"""
@@ -30,7 +49,48 @@ class SafeSearchLevel(Enum):
     STRICT = "strict"
 
 
-@dataclass
+# Enum members by value, so string conversion is a single dict lookup
+_RESULT_TYPES = {member.value: member for member in ResultType}
+_SAFE_SEARCH_LEVELS = {member.value: member for member in SafeSearchLevel}
+
+
+class RawResult(NamedTuple):
+    """
+    A result as returned by a search provider, before processing
+    
+    Attributes:
+        title: The title of the result
+        url: The URL of the result
+        snippet: A short description/snippet
+        source: The source domain or provider
+        date: Publication or last modified date
+        type: Result type name (webpage, news, pdf, ...)
+    """
+    title: str
+    url: str
+    snippet: str
+    source: str = ""
+    date: str = ""
+    type: str = "webpage"
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to dictionary for serialization"""
+        return self._asdict()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RawResult":
+        """Create from dictionary"""
+        return cls(
+            title=data.get("title", ""),
+            url=data.get("url", ""),
+            snippet=data.get("snippet", ""),
+            source=data.get("source", ""),
+            date=data.get("date", ""),
+            type=data.get("type", "webpage")
+        )
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SearchResult:
     """
     Represents a single search result
@@ -56,22 +116,19 @@ class SearchResult:
     
     def __post_init__(self):
         """Validate and normalize data after initialization"""
-        if not self.title.strip():
+        if not self.title or self.title.isspace():
             raise ValueError("Title cannot be empty")
-        if not self.url.strip():
+        if not self.url or self.url.isspace():
             raise ValueError("URL cannot be empty")
-        if not self.snippet.strip():
+        if not self.snippet or self.snippet.isspace():
             raise ValueError("Snippet cannot be empty")
-            
+        
         # Normalize relevance score
         self.relevance_score = max(0.0, min(1.0, self.relevance_score))
         
         # Convert result_type to enum if it's a string
         if isinstance(self.result_type, str):
-            try:
-                self.result_type = ResultType(self.result_type.lower())
-            except ValueError:
-                self.result_type = ResultType.WEBPAGE
+            self.result_type = _RESULT_TYPES.get(self.result_type.lower(), ResultType.WEBPAGE)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -95,13 +152,13 @@ class SearchResult:
             snippet=data["snippet"],
             source=data.get("source", ""),
             date=data.get("date", ""),
-            result_type=ResultType(data.get("result_type", "webpage")),
+            result_type=data.get("result_type", "webpage"),
             relevance_score=data.get("relevance_score", 0.0),
             metadata=data.get("metadata", {})
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SearchFilter:
     """
     Search filtering configuration
@@ -120,34 +177,67 @@ class SearchFilter:
     region: str = "any"
     safe_search: SafeSearchLevel = SafeSearchLevel.MODERATE
     custom_filters: Dict[str, Any] = field(default_factory=dict)
+    # Memoized to_dict(), freeze() and is_active() results plus the
+    # FilterManager validation mark, all cleared whenever a field is assigned
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _frozen_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _active: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name not in _FILTER_DERIVED_STATE:
+            object.__setattr__(self, "_dict_cache", None)
+            object.__setattr__(self, "_frozen_cache", None)
+            object.__setattr__(self, "_active", None)
+            object.__setattr__(self, "_validated", False)
     
     def __post_init__(self):
         """Validate filter values"""
-        valid_date_ranges = ["any", "day", "week", "month", "year"]
-        if self.date_range not in valid_date_ranges:
+        if self.date_range not in _FILTER_DATE_RANGES:
             raise ValueError(f"Invalid date_range: {self.date_range}")
-            
-        valid_content_types = ["any", "pdf", "doc", "image", "video", "news"]
-        if self.content_type not in valid_content_types:
+        
+        if self.content_type not in _FILTER_CONTENT_TYPES:
             self.content_type = "any"
-            
+        
         # Convert safe_search to enum if it's a string
         if isinstance(self.safe_search, str):
-            try:
-                self.safe_search = SafeSearchLevel(self.safe_search.lower())
-            except ValueError:
-                self.safe_search = SafeSearchLevel.MODERATE
+            self.safe_search = _SAFE_SEARCH_LEVELS.get(self.safe_search.lower(), SafeSearchLevel.MODERATE)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization"""
-        return {
-            "date_range": self.date_range,
-            "content_type": self.content_type,
-            "language": self.language,
-            "region": self.region,
-            "safe_search": self.safe_search.value,
-            "custom_filters": self.custom_filters
-        }
+        """
+        Convert to dictionary for serialization
+        
+        The dictionary is cached until a field is reassigned, so callers must
+        not modify it; in-place changes to custom_filters are not tracked.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "date_range": self.date_range,
+                "content_type": self.content_type,
+                "language": self.language,
+                "region": self.region,
+                "safe_search": self.safe_search.value,
+                "custom_filters": self.custom_filters
+            }
+        return self._dict_cache
+    
+    def freeze(self) -> tuple:
+        """
+        Hashable snapshot of the filter values, for use in cache keys
+        
+        Cached like to_dict(); in-place changes to custom_filters are not tracked.
+        """
+        if self._frozen_cache is None:
+            self._frozen_cache = (
+                self.date_range,
+                self.content_type,
+                self.language,
+                self.region,
+                self.safe_search.value,
+                _freeze_value(self.custom_filters)
+            )
+        return self._frozen_cache
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SearchFilter":
@@ -157,30 +247,32 @@ class SearchFilter:
             content_type=data.get("content_type", "any"),
             language=data.get("language", "any"),
             region=data.get("region", "any"),
-            safe_search=SafeSearchLevel(data.get("safe_search", "moderate")),
+            safe_search=data.get("safe_search", "moderate"),
             custom_filters=data.get("custom_filters", {})
         )
     
     def is_active(self) -> bool:
         """Check if any filters are active (not default values)"""
-        return (
-            self.date_range != "any" or
-            self.content_type != "any" or
-            self.language != "any" or
-            self.region != "any" or
-            self.safe_search != SafeSearchLevel.MODERATE or
-            bool(self.custom_filters)
-        )
+        if self._active is None:
+            self._active = (
+                self.date_range != "any" or
+                self.content_type != "any" or
+                self.language != "any" or
+                self.region != "any" or
+                self.safe_search != SafeSearchLevel.MODERATE or
+                bool(self.custom_filters)
+            )
+        return self._active
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SearchHistory:
     """
     Represents a search history entry
     
     Attributes:
         query: The search query
-        timestamp: When the search was performed
+        timestamp: When the search was performed, set on recording if None
         results_count: Number of results returned
         filters: Filter settings used
         execution_time: How long the search took (seconds)
@@ -188,7 +280,7 @@ class SearchHistory:
         session_id: Unique session identifier
     """
     query: str
-    timestamp: datetime
+    timestamp: Optional[datetime] = None
     results_count: int = 0
     filters: Optional[SearchFilter] = None
     execution_time: float = 0.0
@@ -197,7 +289,7 @@ class SearchHistory:
     
     def __post_init__(self):
         """Validate and normalize data"""
-        if not self.query.strip():
+        if not self.query or self.query.isspace():
             raise ValueError("Query cannot be empty")
         if self.results_count < 0:
             self.results_count = 0
@@ -210,7 +302,7 @@ class SearchHistory:
         """Convert to dictionary for serialization"""
         return {
             "query": self.query,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
             "results_count": self.results_count,
             "filters": self.filters.to_dict() if self.filters else None,
             "execution_time": self.execution_time,
@@ -224,10 +316,11 @@ class SearchHistory:
         filters = None
         if data.get("filters"):
             filters = SearchFilter.from_dict(data["filters"])
-            
+        timestamp = data.get("timestamp")
+        
         return cls(
             query=data["query"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
             results_count=data.get("results_count", 0),
             filters=filters,
             execution_time=data.get("execution_time", 0.0),
@@ -236,7 +329,7 @@ class SearchHistory:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SearchQuery:
     """
     Represents a parsed search query with operators
@@ -261,41 +354,49 @@ class SearchQuery:
     @classmethod
     def parse(cls, query: str) -> "SearchQuery":
         """Parse a raw query string into structured components"""
-        import re
-        
         parsed = cls(raw_query=query)
         
-        # Find exact phrases (quoted text)
-        phrase_pattern = r'"([^"]+)"'
-        phrases = re.findall(phrase_pattern, query)
-        parsed.exact_phrases = phrases
-        
-        # Remove phrases from query for further processing
-        query_without_phrases = re.sub(phrase_pattern, '', query)
+        # Find exact phrases (quoted text), keeping the text between them
+        remainder = []
+        start = 0
+        scan = 0
+        while (open_quote := query.find('"', scan)) != -1:
+            close_quote = query.find('"', open_quote + 1)
+            if close_quote == -1:
+                break
+            if close_quote == open_quote + 1:
+                # An empty pair is literal text; its second quote may open a phrase
+                scan = close_quote
+                continue
+            parsed.exact_phrases.append(query[open_quote + 1:close_quote])
+            remainder.append(query[start:open_quote])
+            start = scan = close_quote + 1
+        remainder.append(query[start:])
         
-        # Find site filters
-        site_pattern = r'site:(\S+)'
-        site_match = re.search(site_pattern, query_without_phrases)
-        if site_match:
-            parsed.site_filter = site_match.group(1)
-            query_without_phrases = re.sub(site_pattern, '', query_without_phrases)
-        
-        # Find filetype filters
-        filetype_pattern = r'filetype:(\S+)'
-        filetype_match = re.search(filetype_pattern, query_without_phrases)
-        if filetype_match:
-            parsed.filetype_filter = filetype_match.group(1)
-            query_without_phrases = re.sub(filetype_pattern, '', query_without_phrases)
-        
-        # Split remaining terms
-        words = query_without_phrases.split()
-        
-        for word in words:
+        # Split remaining terms; removed phrases join the text around them
+        for word in "".join(remainder).split():
+            # Site and filetype operators run to the end of the word
+            if ":" in word:
+                site = word.find("site:")
+                if site != -1 and site + 5 < len(word):
+                    if not parsed.site_filter:
+                        parsed.site_filter = word[site + 5:]
+                    word = word[:site]
+                
+                filetype = word.find("filetype:")
+                if filetype != -1 and filetype + 9 < len(word):
+                    if not parsed.filetype_filter:
+                        parsed.filetype_filter = word[filetype + 9:]
+                    word = word[:filetype]
+                
+                if not word:
+                    continue
+            
             if word.startswith('+'):
                 parsed.required_terms.append(word[1:])
             elif word.startswith('-'):
                 parsed.excluded_terms.append(word[1:])
-            elif word.strip():
+            else:
                 parsed.terms.append(word)
         
         return parsed
@@ -326,7 +427,33 @@ class SearchQuery:
         return " ".join(parts)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
+class SearchStats:
+    """
+    Running search counters for an engine session
+    
+    Attributes:
+        total_searches: Number of completed (uncached) searches
+        total_results: Sum of results across those searches
+        total_time: Sum of their execution times (seconds)
+        cache_hits: Number of searches answered from cache
+    """
+    total_searches: int = 0
+    total_results: int = 0
+    total_time: float = 0.0
+    cache_hits: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "total_searches": self.total_searches,
+            "total_results": self.total_results,
+            "total_time": self.total_time,
+            "cache_hits": self.cache_hits
+        }
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Bookmark:
     """
     Represents a bookmarked search result
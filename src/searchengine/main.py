@@ -6,85 +6,171 @@ This module provides the main entry point for the SearchEngine Pro application.
 It handles command line arguments, configuration loading, and application startup.
 """
 
+import os
 import sys
 import signal
 import argparse
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import FrameType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TextIO
 
-import click
-from rich.console import Console
-
-from .core.engine import WebSearchEngine
-from .ui.console import ConsoleInterface
-from .utils.config import Config
-from .utils.helpers import setup_logging
 from . import __version__
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_VERSION_TEXT = f"SearchEngine Pro, version {__version__}"
+
+logger = logging.getLogger(__name__)
+
+# The engine, UI and rich are imported inside main() so that --help and
+# --version return without loading them
+_console: Optional["Console"] = None
+
 
-console = Console()
+def _get_console() -> "Console":
+    """Create the rich console on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 
-def signal_handler(sig, frame):
+def signal_handler(sig: int, frame: Optional[FrameType]) -> None:
     """Handle graceful shutdown on SIGINT (Ctrl+C)"""
-    console.print("\n[yellow]Shutting down SearchEngine Pro...[/yellow]")
+    # Plain stderr so an interrupt never has to import or render through rich
+    sys.stderr.write("\nShutting down SearchEngine Pro...\n")
     sys.exit(0)
 
 
-@click.command()
-@click.version_option(version=__version__, prog_name="SearchEngine Pro")
-@click.option(
-    "--config", "-c",
-    type=click.Path(exists=True, path_type=Path),
-    help="Path to configuration file"
-)
-@click.option(
-    "--debug", "-d",
-    is_flag=True,
-    help="Enable debug logging"
-)
-@click.option(
-    "--no-colors",
-    is_flag=True,
-    help="Disable colored output"
-)
-@click.option(
-    "--results-per-page",
-    type=int,
-    default=10,
-    help="Number of results per page (default: 10)"
-)
-@click.option(
-    "--timeout",
-    type=int,
-    default=30,
-    help="Request timeout in seconds (default: 30)"
-)
-@click.option(
-    "--query", "-q",
-    help="Execute search query and exit"
-)
-@click.option(
-    "--batch",
-    type=click.File('r'),
-    help="Read queries from file (one per line)"
-)
-@click.option(
-    "--output", "-o",
-    type=click.File('w'),
-    help="Output results to file"
+def _existing_path(value: str) -> Path:
+    """argparse type for a path that must already exist"""
+    path = Path(value)
+    if not path.exists():
+        raise argparse.ArgumentTypeError(f"Path '{value}' does not exist.")
+    return path
+
+
+def _batch_file(value: str) -> Path:
+    """argparse type for the --batch file, a regular file or '-' for stdin"""
+    if value == "-":
+        return Path(value)
+    path = _existing_path(value)
+    if path.is_dir():
+        raise argparse.ArgumentTypeError(f"File '{value}' is a directory.")
+    return path
+
+
+def _read_batch_queries(path: Path) -> List[str]:
+    """Read the whole batch file up front through a 128 KiB buffer, '-' meaning stdin"""
+    if str(path) == "-":
+        return sys.stdin.read().splitlines()
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        # Ask for aggressive readahead; only available on POSIX systems
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        pass
+    with os.fdopen(fd, 'r', encoding='utf-8', buffering=1 << 17) as f:
+        return f.read().splitlines()
+
+
+def _output_path(value: str) -> Path:
+    """argparse type for the --output path; the file is opened by main()"""
+    path = Path(value)
+    if path.is_dir():
+        raise argparse.ArgumentTypeError(f"File '{value}' is a directory.")
+    return path
+
+
+def _open_output(path: Path) -> TextIO:
+    """Open the --output file behind a 1 MiB buffer, '-' meaning stdout"""
+    if str(path) == "-":
+        return sys.stdout
+    from .utils.helpers import open_buffered_output
+    return open_buffered_output(str(path))
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser, once per process"""
+    parser = argparse.ArgumentParser(
+        prog="searchengine",
+        description="SearchEngine Pro - Interactive Console Web Search Engine",
+        epilog=(
+            "Examples:\n"
+            "  searchengine                       # Start interactive mode\n"
+            "  searchengine -q \"python tutorial\"  # Single query\n"
+            "  searchengine --batch queries.txt   # Batch processing"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=_VERSION_TEXT
+    )
+    parser.add_argument(
+        "--config", "-c",
+        type=_existing_path,
+        help="Path to configuration file"
+    )
+    parser.add_argument(
+        "--debug", "-d",
+        action="store_true",
+        help="Enable debug logging"
+    )
+    parser.add_argument(
+        "--no-colors",
+        action="store_true",
+        help="Disable colored output"
+    )
+    parser.add_argument(
+        "--results-per-page",
+        type=int,
+        default=10,
+        help="Number of results per page (default: 10)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=30,
+        help="Request timeout in seconds (default: 30)"
+    )
+    parser.add_argument(
+        "--query", "-q",
+        help="Execute search query and exit"
+    )
+    parser.add_argument(
+        "--batch",
+        type=_batch_file,
+        help="Read queries from file (one per line), '-' for stdin"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        type=_output_path,
+        help="Output results to file"
+    )
+    return parser
+
+
+# Parsed options for a bare invocation, used without building the parser
+_DEFAULTS = argparse.Namespace(
+    config=None,
+    debug=False,
+    no_colors=False,
+    results_per_page=10,
+    timeout=30,
+    query=None,
+    batch=None,
+    output=None
 )
-def main(
-    config: Optional[Path],
-    debug: bool,
-    no_colors: bool,
-    results_per_page: int,
-    timeout: int,
-    query: Optional[str],
-    batch: Optional[click.File],
-    output: Optional[click.File]
-):
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """
     SearchEngine Pro - Interactive Console Web Search Engine
     
@@ -95,63 +181,89 @@ def main(
         searchengine                    # Start interactive mode
         searchengine -q "python tutorial"  # Single query
         searchengine --batch queries.txt   # Batch processing
+    
+    Args:
+        argv: Command line arguments, defaults to sys.argv[1:]
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv == ["--version"]:
+        print(_VERSION_TEXT)
+        return
+    # Plain interactive start is the common case and needs no parsing
+    args = _DEFAULTS if not argv else _build_parser().parse_args(argv)
     
-    # Setup signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
+    from .core.engine import WebSearchEngine
+    from .ui.console import ConsoleInterface
+    from .utils.config import Config
+    from .utils.helpers import setup_logging
     
     # Setup logging
-    log_level = logging.DEBUG if debug else logging.INFO
+    log_level = logging.DEBUG if args.debug else logging.INFO
     setup_logging(log_level)
+    # Mode notices are only worth formatting when debugging
+    logger.setLevel(logging.DEBUG if args.debug else logging.WARNING)
     
+    engine = None
+    output: Optional[TextIO] = None
     try:
         # Load configuration
-        app_config = Config.load(config_path=config)
+        app_config = Config.load(config_path=args.config)
         
         # Override config with command line options
-        if no_colors:
-            app_config.display.colors = False
-        if results_per_page != 10:
-            app_config.search.results_per_page = results_per_page
-        if timeout != 30:
-            app_config.search.default_timeout = timeout
-            
+        overrides: Dict[str, Dict[str, Any]] = {}
+        if args.no_colors:
+            overrides.setdefault('display', {})['colors'] = False
+        if args.results_per_page != 10:
+            overrides.setdefault('search', {})['results_per_page'] = args.results_per_page
+        if args.timeout != 30:
+            overrides.setdefault('search', {})['default_timeout'] = args.timeout
+        if overrides:
+            app_config.apply_overrides(overrides)
+        
+        # Setup signal handlers
+        signal.signal(signal.SIGINT, signal_handler)
+        
         # Initialize the search engine
         engine = WebSearchEngine(config=app_config)
         
-        # Initialize the console interface
+        # Initialize the console interface, opening the output file last so
+        # earlier failures never leave an empty file behind
+        if args.output is not None:
+            output = _open_output(args.output)
         ui = ConsoleInterface(engine=engine, config=app_config, output_file=output)
         
         # Handle different execution modes
-        if batch:
+        if args.batch:
             # Batch mode - process queries from file
-            console.print("[green]Running in batch mode...[/green]")
-            ui.run_batch_mode(batch)
-            
-        elif query:
+            logger.info("Running in batch mode")
+            ui.run_batch_mode(_read_batch_queries(args.batch))
+        
+        elif args.query:
             # Single query mode
-            console.print(f"[green]Searching for: {query}[/green]")
-            ui.run_single_query(query)
-            
+            logger.info("Searching for: %s", args.query)
+            ui.run_single_query(args.query)
+        
         else:
             # Interactive mode (default)
             ui.run_interactive_mode()
-            
+    
     except KeyboardInterrupt:
-        console.print("\n[yellow]Operation cancelled by user[/yellow]")
+        _get_console().print("\n[yellow]Operation cancelled by user[/yellow]")
         sys.exit(1)
-        
+    
     except Exception as e:
-        if debug:
-            console.print_exception()
+        if args.debug:
+            _get_console().print_exception()
         else:
-            console.print(f"[red]Error: {e}[/red]")
+            _get_console().print(f"[red]Error: {e}[/red]")
         sys.exit(1)
-
-
-def cli():
-    """Entry point for setuptools console_scripts"""
-    main()
+    
+    finally:
+        if engine is not None:
+            engine.shutdown()
+        if output is not None and output is not sys.stdout:
+            output.close()
 
 
 if __name__ == "__main__":
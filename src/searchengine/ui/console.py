@@ -7,38 +7,30 @@ for the search engine with rich visual elements and enhanced user experience.
 
 import os
 import sys
-import time
+import signal
 import asyncio
-from typing import List, Optional, TextIO, Dict, Any
+import threading
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Iterable, List, Optional, TextIO, Tuple, Dict, Any
 import logging
 from datetime import datetime
 
-from rich.console import Console
+from rich import box
+from rich.console import Console, Group
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.table import Table
 from rich.panel import Panel
+from rich.style import Style
 from rich.text import Text
-from rich.layout import Layout
 from rich.align import Align
-from rich.columns import Columns
-from rich.tree import Tree
-from rich.rule import Rule
 from rich.status import Status
-from rich.live import Live
-from rich.prompt import Prompt, Confirm
-from rich.markdown import Markdown
-from rich.syntax import Syntax
+from rich.errors import LiveError
 
-try:
-    from prompt_toolkit import prompt
-    from prompt_toolkit.completion import WordCompleter
-    from prompt_toolkit.history import InMemoryHistory
-    from prompt_toolkit.shortcuts import clear
-    from prompt_toolkit.key_binding import KeyBindings
-    from prompt_toolkit.formatted_text import HTML
-    PROMPT_TOOLKIT_AVAILABLE = True
-except ImportError:
-    PROMPT_TOOLKIT_AVAILABLE = False
+# prompt_toolkit is only needed by interactive mode, so it is imported there
+PROMPT_TOOLKIT_AVAILABLE = find_spec("prompt_toolkit") is not None
+if TYPE_CHECKING:
+    from prompt_toolkit import PromptSession
 
 from ..core.engine import WebSearchEngine
 from ..core.models import SearchResult, SearchFilter
@@ -48,6 +40,292 @@ from ..utils.helpers import format_duration, format_number
 logger = logging.getLogger(__name__)
 
 
+_LOGO_ART = """
+╔══════════════════════════════════════════════════════════════╗
+║             🔍 SearchEngine Pro v3.2 🔍                    ║
+║                                                              ║
+║        ✨ Enhanced Interactive Console Mode ✨              ║
+║                                                              ║
+║  🚀 Now with real Google search integration!                ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+
+# Title icon for each result type
+_TYPE_ICONS = {
+    "webpage": "🌐",
+    "pdf": "📄",
+    "doc": "📝",
+    "news": "📰",
+    "video": "🎥",
+    "image": "🖼️"
+}
+
+
+# Panels built only from static text are created once per color theme;
+# rich renderables hold no render state, so they can be printed repeatedly
+@lru_cache(maxsize=8)
+def _startup_screen(
+    primary_color: str,
+    secondary_color: str,
+    accent_color: str,
+    success_color: str,
+    muted_color: str
+) -> Group:
+    """Logo, feature highlights and quick start panels as one renderable"""
+    startup_panel = Panel(
+        Align.center(_LOGO_ART),
+        border_style=f"{primary_color} bold",
+        padding=(1, 2)
+    )
+    
+    features = Table(show_header=False, box=None, padding=(0, 2))
+    features.add_column(style=success_color)
+    features.add_column(style="white")
+    
+    features.add_row("🔍", "Real Google search results")
+    features.add_row("⚡", "Lightning-fast response times")
+    features.add_row("📱", "Modern interactive interface")
+    features.add_row("🎯", "Advanced search operators")
+    features.add_row("📊", "Search history and analytics")
+    features.add_row("🛠️", "Powerful filtering tools")
+    
+    features_panel = Panel(
+        features,
+        title="✨ Features",
+        border_style=secondary_color,
+        padding=(0, 1)
+    )
+    
+    quick_start = f"""
+[{primary_color} bold]Quick Start:[/]
+• Type any search query to begin
+• Use [bold]?[/] or [bold]help[/] for commands
+• Try: [italic]"python tutorial"[/], [italic]site:github.com[/], [italic]filetype:pdf[/]
+
+[{muted_color}]Press Ctrl+C to interrupt, type 'exit' to quit[/]
+"""
+    quick_start_panel = Panel(
+        quick_start.strip(),
+        title="🚀 Ready to Search",
+        border_style=accent_color,
+        padding=(0, 1)
+    )
+    
+    return Group(startup_panel, features_panel, quick_start_panel, "")
+
+
+@lru_cache(maxsize=8)
+def _goodbye_panel(primary_color: str) -> Panel:
+    """Goodbye panel shown when leaving interactive mode"""
+    return Panel(
+        Align.center(
+            Text("Thank you for using SearchEngine Pro!\n✨ Happy searching! ✨", 
+                 style=f"{primary_color} bold")
+        ),
+        title="👋 Goodbye",
+        border_style=primary_color,
+        padding=(1, 2)
+    )
+
+
+# Help screen sections: title and (command, description) rows
+_HELP_SECTIONS = (
+    ("🔍 Search Commands", (
+        ("Basic Search", "Type any query to search"),
+        ("Site Search", "site:example.com query"),
+        ("File Type", "filetype:pdf query"),
+        ("Exact Phrase", '"exact phrase"'),
+        ("Exclude Words", "query -unwanted"),
+        ("Required Words", "query +required"),
+    )),
+    ("🧭 Navigation Commands", (
+        ("n, next", "Go to next page"),
+        ("p, prev", "Go to previous page"),
+        ("page #", "Go to specific page"),
+        ("first", "Go to first page"),
+        ("last", "Go to last page"),
+        ("o #", "Open result # in browser"),
+        ("back", "Go back to previous view"),
+    )),
+    ("🛠️ Tool Commands", (
+        ("f, filter", "Show search filters"),
+        ("h, history", "Show search history"),
+        ("s, save", "Save current search"),
+        ("bookmarks", "Show saved bookmarks"),
+        ("stats", "Show search statistics"),
+        ("settings", "Show settings"),
+    )),
+    ("⚙️ System Commands", (
+        ("c, clear", "Clear screen"),
+        ("r, refresh", "Refresh current results"),
+        ("?, help", "Show this help"),
+        ("exit, quit", "Exit application"),
+    )),
+)
+
+# Below this width the two-by-two help layout wraps, so one table is used
+_HELP_COLUMNS_MIN_WIDTH = 100
+
+# Number of recent searches shown by the history command
+_HISTORY_DISPLAY_LIMIT = 10
+
+
+@lru_cache(maxsize=16)
+def _help_screen(
+    primary_color: str,
+    secondary_color: str,
+    accent_color: str,
+    success_color: str,
+    error_color: str,
+    compact: bool = False
+) -> Group:
+    """
+    Full command reference shown by the help command
+    
+    The compact form lists every section in one table instead of four
+    panels laid out in columns.
+    """
+    section_colors = (primary_color, secondary_color, accent_color, error_color)
+    
+    header_panel = Panel(
+        f"[bold {primary_color}]SearchEngine Pro v3.2 - Help Guide[/]\n\n"
+        f"Welcome to the enhanced interactive search engine! 🚀",
+        title="❓ Help",
+        border_style=primary_color,
+        padding=(1, 2)
+    )
+    
+    tips_panel = Panel(
+        f"[{success_color}]💡 Pro Tips:[/]\n"
+        f"• Use quotes for exact phrases: \"machine learning\"\n"
+        f"• Combine operators: site:github.com \"python tutorial\"\n"
+        f"• Press Tab for command autocomplete (if available)\n"
+        f"• Use Ctrl+C to interrupt long operations",
+        title="✨ Pro Tips",
+        border_style=success_color
+    )
+    
+    if compact:
+        commands_table = Table(show_header=False, box=None, padding=(0, 1))
+        commands_table.add_column(min_width=15, no_wrap=True)
+        commands_table.add_column(style="white")
+        for (title, commands), color in zip(_HELP_SECTIONS, section_colors):
+            commands_table.add_row(f"[bold {color}]{title}[/]", "")
+            for command, description in commands:
+                commands_table.add_row(f"[{color} bold]{command}[/]", description)
+            commands_table.add_row("", "")
+        
+        commands_panel = Panel(commands_table, border_style=primary_color)
+        return Group(header_panel, commands_panel, tips_panel)
+    
+    from rich.columns import Columns
+    
+    section_panels = []
+    for (title, commands), color in zip(_HELP_SECTIONS, section_colors):
+        section_table = Table(title=title, show_header=False)
+        section_table.add_column(style=f"{color} bold", width=15)
+        section_table.add_column(style="white")
+        for command, description in commands:
+            section_table.add_row(command, description)
+        section_panels.append(Panel(section_table, border_style=color))
+    
+    # Create columns layout
+    help_columns = Columns(section_panels[:2])
+    help_columns2 = Columns(section_panels[2:])
+    
+    return Group(header_panel, help_columns, help_columns2, tips_panel)
+
+
+@lru_cache(maxsize=8)
+def _filters_table(primary_color: str, muted_color: str) -> Table:
+    """Reference of the supported search operators"""
+    filters_table = Table(
+        title="🔍 Available Search Filters", show_header=True,
+        box=box.ROUNDED, border_style=primary_color
+    )
+    filters_table.add_column("Operator", style=f"{primary_color} bold")
+    filters_table.add_column("Description", style="white")
+    filters_table.add_column("Example", style=f"{muted_color} italic")
+    
+    filters_data = [
+        ("site:", "Search within specific website", "site:github.com python"),
+        ("filetype:", "Search for specific file types", "filetype:pdf machine learning"),
+        ('"quotes"', "Search for exact phrase", '"machine learning tutorial"'),
+        ("+required", "Require specific word", "+python tutorial"),
+        ("-exclude", "Exclude specific word", "python -java"),
+        ("OR", "Search for either term", "python OR javascript"),
+        ("*", "Wildcard for unknown words", "how to * python"),
+    ]
+    
+    for operator, description, example in filters_data:
+        filters_table.add_row(operator, description, example)
+    
+    return filters_table
+
+
+@lru_cache(maxsize=8)
+def _settings_table(accent_color: str, settings_data: Tuple[Tuple[str, str], ...]) -> Table:
+    """Table of the current settings, keyed by the displayed values"""
+    settings_table = Table(
+        title="⚙️ Current Settings", show_header=False,
+        box=box.ROUNDED, border_style=accent_color
+    )
+    settings_table.add_column(style=f"{accent_color} bold", width=25)
+    settings_table.add_column(style="white")
+    
+    for label, value in settings_data:
+        settings_table.add_row(label, value)
+    
+    return settings_table
+
+
+# How each navigation command is invoked, for the no-active-search hint
+_NAV_USAGE = {
+    'next': "'n' or 'next'",
+    'prev': "'p' or 'prev'",
+    'first': "'first'",
+    'last': "'last'",
+    'page': "'page #'",
+}
+
+
+@lru_cache(maxsize=32)
+def _no_search_panel(warning_color: str, usage: str) -> Panel:
+    """Panel shown when a navigation command is used before any search"""
+    return Panel(
+        f"[{warning_color}]No active search to paginate[/]\n\n"
+        f"[white]Perform a search first, then use {usage}[/]",
+        title="📄 No Active Search",
+        border_style=warning_color
+    )
+
+
+@lru_cache(maxsize=8)
+def _navigation_help_panel(accent_color: str) -> Panel:
+    """Quick command reference shown under each results page"""
+    nav_table = Table(show_header=False, box=None)
+    nav_table.add_column(style=f"{accent_color} bold")
+    nav_table.add_column(style="white")
+    
+    nav_table.add_row("n, next", "→ Next page")
+    nav_table.add_row("p, prev", "← Previous page")
+    nav_table.add_row("page #", "📄 Go to page #")
+    nav_table.add_row("first", "⏮️ First page")
+    nav_table.add_row("last", "⏭️ Last page")
+    nav_table.add_row("o #", "🔗 Open result # in browser")
+    nav_table.add_row("f, filter", "🔍 Filter results")
+    nav_table.add_row("h, history", "📚 Search history")
+    nav_table.add_row("?, help", "❓ Show all commands")
+    
+    return Panel(
+        nav_table,
+        title="⌨️  Quick Commands",
+        border_style=accent_color,
+        padding=(0, 1)
+    )
+
+
 class EnhancedConsoleInterface:
     """
     Beautiful and interactive console interface for the search engine
@@ -60,10 +338,36 @@ class EnhancedConsoleInterface:
         """Initialize the enhanced console interface"""
         self.engine = engine
         self.config = config
+        self.output_file = output_file
         self.console = Console(file=output_file, force_terminal=True if not output_file else False)
+        self._watch_terminal_size()
         self.running = True
-        self.search_history = InMemoryHistory() if PROMPT_TOOLKIT_AVAILABLE else None
-        self.command_completer = self._create_command_completer()
+        # Prompt state is only needed by interactive mode, which creates it
+        self.search_history = None
+        self.command_completer = None
+        self._prompt_session: Optional["PromptSession"] = None
+        self._prompt_message: Optional[Any] = None
+        
+        # Commands that take no argument, by every name they answer to
+        self._commands = {
+            'n': self.next_page, 'next': self.next_page,
+            'p': self.prev_page, 'prev': self.prev_page, 'previous': self.prev_page,
+            'first': self.first_page,
+            'last': self.last_page,
+            'f': self.show_enhanced_filters, 'filter': self.show_enhanced_filters,
+            'filters': self.show_enhanced_filters,
+            'h': self.show_enhanced_history, 'history': self.show_enhanced_history,
+            's': self.save_search, 'save': self.save_search,
+            'bookmarks': self.show_bookmarks,
+            'c': self.clear_screen, 'clear': self.clear_screen,
+            'r': self.refresh_search, 'refresh': self.refresh_search,
+            'help': self.show_enhanced_help, '?': self.show_enhanced_help,
+            'stats': self.show_stats,
+            'settings': self.show_settings,
+            'exit': self.exit_application, 'quit': self.exit_application,
+            'q': self.exit_application,
+            'back': self.go_back,
+        }
         
         # Visual themes
         self.primary_color = "bright_blue"
@@ -74,11 +378,58 @@ class EnhancedConsoleInterface:
         self.error_color = "bright_red"
         self.muted_color = "dim"
         
+        # Theme styles and markup tags reused on every screen
+        self._primary_bold = f"{self.primary_color} bold"
+        self._spinner_tag = f"[bold {self.secondary_color}]"
+        self._query_prefix = f"[{self.primary_color}]❯[/] [bold]"
+        # Parsed styles for the #, query, results and time history cells
+        self._history_styles = tuple(Style.parse(style) for style in (
+            self.muted_color, self._primary_bold, self.success_color, self.muted_color
+        ))
+        
+        self._max_snippet_length = config.display.max_snippet_length
+        
+        # Results of the page last displayed
+        self._current_results: List[SearchResult] = []
+        
+        # Page navigation restarts one spinner rather than building a new one
+        self._nav_status = Status("", console=self.console)
+        
+        # Result markup with the theme colors filled in once
+        self._result_template = (
+            f"[bold {self.primary_color}]{{icon}} {{title}}[/]\n"
+            f"[{self.secondary_color}]🔗 {{url}}[/]\n"
+            f"[white]{{snippet}}[/]"
+        )
+        self._result_meta_template = self._result_template + f"\n[{self.muted_color}]{{meta}}[/]"
+    
+    def _watch_terminal_size(self):
+        """
+        Pin the console to the current terminal size and re-pin on resize
+        
+        rich otherwise asks the terminal for its size on every render. The
+        SIGWINCH handler is reinstalled after each prompt, because
+        prompt_toolkit restores the default handler when a prompt ends.
+        """
+        if self.output_file is not None or "COLUMNS" in os.environ or "LINES" in os.environ:
+            return  # Writing to a file, or the size is fixed by the environment
+        try:
+            size = os.get_terminal_size(sys.__stdout__.fileno())
+        except (AttributeError, ValueError, OSError):
+            return  # Not attached to a terminal
+        self.console.size = (size.columns, size.lines)
+        
+        sigwinch = getattr(signal, "SIGWINCH", None)
+        if sigwinch is not None and threading.current_thread() is threading.main_thread():
+            signal.signal(sigwinch, lambda signum, frame: self._watch_terminal_size())
+    
     def _create_command_completer(self):
         """Create autocomplete for commands"""
         if not PROMPT_TOOLKIT_AVAILABLE:
             return None
-            
+        
+        from prompt_toolkit.completion import WordCompleter
+        
         commands = [
             'next', 'prev', 'previous', 'open', 'filter', 'filters',
             'history', 'save', 'bookmarks', 'clear', 'refresh', 'help',
@@ -88,21 +439,37 @@ class EnhancedConsoleInterface:
     
     def run_interactive_mode(self):
         """Run the enhanced interactive search engine interface"""
+        asyncio.run(self.run_interactive_mode_async())
+    
+    async def run_interactive_mode_async(self):
+        """
+        Interactive loop on one event loop, reading input with prompt_async
+        
+        The synchronous prompt() starts and tears down an event loop for
+        every line read; here a single loop serves the whole session.
+        Searches run on the engine's loop and are awaited, so they never
+        block this one.
+        """
+        if PROMPT_TOOLKIT_AVAILABLE and self.search_history is None:
+            from prompt_toolkit.history import InMemoryHistory
+            self.search_history = InMemoryHistory()
+            self.command_completer = self._create_command_completer()
         self.display_enhanced_startup()
         
         try:
             while self.running:
                 try:
-                    user_input = self._get_enhanced_input()
+                    user_input = await self._get_enhanced_input()
+                    self._watch_terminal_size()
                     if user_input:
-                        self.handle_command(user_input)
+                        await self.handle_command(user_input)
                     else:
                         self.console.print()
                 except KeyboardInterrupt:
                     self._show_interrupt_message()
                 except EOFError:
                     break
-                    
+        
         except Exception as e:
             self.console.print(Panel(
                 f"[{self.error_color}]Unexpected error: {e}[/]",
@@ -113,21 +480,26 @@ class EnhancedConsoleInterface:
             if self.running:
                 self._show_goodbye_message()
     
-    def _get_enhanced_input(self) -> str:
+    async def _get_enhanced_input(self) -> str:
         """Get user input with enhanced prompt and autocomplete"""
         if PROMPT_TOOLKIT_AVAILABLE:
             try:
-                # Create a beautiful prompt
-                prompt_text = HTML('<ansicyan><b>🔍 SearchEngine Pro</b></ansicyan> <ansibrightblue>❯</ansibrightblue> ')
-                
-                return prompt(
-                    prompt_text,
-                    completer=self.command_completer,
-                    history=self.search_history,
-                    complete_style="column",
-                    mouse_support=True
-                ).strip()
-            except:
+                # One session is reused so its renderer and key bindings
+                # are only set up for the first prompt
+                if self._prompt_session is None:
+                    from prompt_toolkit import PromptSession
+                    from prompt_toolkit.formatted_text import HTML
+                    from prompt_toolkit.shortcuts import CompleteStyle
+                    
+                    self._prompt_message = HTML('<ansicyan><b>🔍 SearchEngine Pro</b></ansicyan> <ansibrightblue>❯</ansibrightblue> ')
+                    self._prompt_session = PromptSession(
+                        completer=self.command_completer,
+                        history=self.search_history,
+                        complete_style=CompleteStyle.COLUMN,
+                        mouse_support=True
+                    )
+                return (await self._prompt_session.prompt_async(self._prompt_message)).strip()
+            except Exception:
                 # Fallback to simple input
                 pass
         
@@ -148,21 +520,20 @@ class EnhancedConsoleInterface:
     
     def _show_goodbye_message(self):
         """Show a beautiful goodbye message"""
-        goodbye_panel = Panel(
-            Align.center(
-                Text("Thank you for using SearchEngine Pro!\n✨ Happy searching! ✨", 
-                     style=f"{self.primary_color} bold")
-            ),
-            title="👋 Goodbye",
-            border_style=self.primary_color,
-            padding=(1, 2)
-        )
+        goodbye_panel = _goodbye_panel(self.primary_color)
         self.console.print(goodbye_panel)
     
     def run_single_query(self, query: str):
         """Run a single query with enhanced output"""
         self._show_single_query_header(query)
-        self.process_search(query)
+        asyncio.run(self.process_search(query))
+        self._commit_output()
+    
+    def _commit_output(self):
+        """Write buffered --output data at a query boundary"""
+        commit = getattr(self.output_file, "commit", None)
+        if commit is not None:
+            commit()
     
     def _show_single_query_header(self, query: str):
         """Show header for single query mode"""
@@ -173,9 +544,9 @@ class EnhancedConsoleInterface:
         )
         self.console.print(header)
     
-    def run_batch_mode(self, batch_file: TextIO):
-        """Process queries from a batch file with enhanced progress tracking"""
-        queries = [line.strip() for line in batch_file if line.strip() and not line.startswith('#')]
+    def run_batch_mode(self, batch_lines: Iterable[str]):
+        """Process queries from batch file lines with enhanced progress tracking"""
+        queries = [line.strip() for line in batch_lines if line.strip() and not line.startswith('#')]
         
         if not queries:
             self.console.print(Panel(
@@ -185,114 +556,79 @@ class EnhancedConsoleInterface:
             ))
             return
         
-        # Create progress bar for batch processing
+        # Create progress bar for batch processing; results are printed
+        # above it, so a few redraws a second are plenty
         with Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]Processing queries..."),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=self.console
+            console=self.console,
+            refresh_per_second=4,
+            transient=True
         ) as progress:
             task = progress.add_task("Batch processing", total=len(queries))
             
-            for i, query in enumerate(queries):
-                progress.update(task, description=f"Query {i+1}: {query[:30]}...")
-                self.console.print(f"\n[{self.muted_color}]── Query {i+1}/{len(queries)} ──[/]")
-                self.process_search(query)
+            # Queries run concurrently; each is rendered as soon as it finishes
+            searches = self.engine.search_many(queries)
+            for index, (results, total_results, search_time) in searches:
+                query = queries[index]
+                self.console.print(f"\n[{self.muted_color}]── Query {index+1}/{len(queries)} ──[/]")
+                self.console.print(f"{self._query_prefix}{query}[/]\n")
+                self.display_enhanced_results(results, total_results, search_time)
+                self._commit_output()
                 progress.advance(task)
-                time.sleep(0.1)  # Brief pause between queries
     
     def display_enhanced_startup(self):
         """Display beautiful startup interface with animations"""
-        # Clear screen for clean start
-        self.console.clear()
-        
-        # Create animated startup
-        logo_art = """
-╔══════════════════════════════════════════════════════════════╗
-║             🔍 SearchEngine Pro v3.2 🔍                    ║
-║                                                              ║
-║        ✨ Enhanced Interactive Console Mode ✨              ║
-║                                                              ║
-║  🚀 Now with real Google search integration!                ║
-╚══════════════════════════════════════════════════════════════╝
-"""
-        
-        startup_panel = Panel(
-            Align.center(logo_art),
-            border_style=f"{self.primary_color} bold",
-            padding=(1, 2)
+        startup_screen = _startup_screen(
+            self.primary_color, self.secondary_color, self.accent_color,
+            self.success_color, self.muted_color
         )
         
-        self.console.print(startup_panel)
-        
-        # Show feature highlights
-        features = Table(show_header=False, box=None, padding=(0, 2))
-        features.add_column(style=self.success_color)
-        features.add_column(style="white")
-        
-        features.add_row("🔍", "Real Google search results")
-        features.add_row("⚡", "Lightning-fast response times")
-        features.add_row("📱", "Modern interactive interface")
-        features.add_row("🎯", "Advanced search operators")
-        features.add_row("📊", "Search history and analytics")
-        features.add_row("🛠️", "Powerful filtering tools")
-        
-        features_panel = Panel(
-            features,
-            title="✨ Features",
-            border_style=self.secondary_color,
-            padding=(0, 1)
-        )
-        
-        self.console.print(features_panel)
-        
-        # Quick start guide
-        quick_start = f"""
-[{self.primary_color} bold]Quick Start:[/]
-• Type any search query to begin
-• Use [bold]?[/] or [bold]help[/] for commands
-• Try: [italic]"python tutorial"[/], [italic]site:github.com[/], [italic]filetype:pdf[/]
-
-[{self.muted_color}]Press Ctrl+C to interrupt, type 'exit' to quit[/]
-"""
-        
-        self.console.print(Panel(
-            quick_start.strip(),
-            title="🚀 Ready to Search",
-            border_style=self.accent_color,
-            padding=(0, 1)
-        ))
-        
-        self.console.print()
+        # Clear screen for clean start; the console buffers both until the
+        # block exits, so the whole screen goes out in one write
+        with self.console:
+            self.console.clear()
+            self.console.print(startup_screen)
     
-    def display_enhanced_loading(self, query: str):
-        """Display beautiful loading animation with progress"""
-        self.console.print(f"[{self.primary_color}]❯[/] [bold]{query}[/]\n")
-        
-        # Enhanced loading with status
-        with Status(
-            f"[bold {self.secondary_color}]Searching Google...",
+    async def display_enhanced_loading(self, query: str) -> Tuple[List[SearchResult], int, float]:
+        """Run the search behind a loading spinner and return its results"""
+        self.console.print(f"{self._query_prefix}{query}[/]\n")
+        
+        # The spinner runs for exactly as long as the search does
+        status: Optional[Status]
+        status = Status(
+            f"{self._spinner_tag}Searching Google...",
             spinner="dots12",
             console=self.console
-        ) as status:
-            # Simulate search stages
-            stages = [
-                ("Connecting to Google...", 0.3),
-                ("Parsing search query...", 0.2),
-                ("Fetching results...", 0.8),
-                ("Processing metadata...", 0.4),
-                ("Organizing results...", 0.3)
-            ]
-            
-            for stage_text, duration in stages:
-                status.update(f"[bold {self.secondary_color}]{stage_text}")
-                time.sleep(duration)
+        )
+        try:
+            status.start()
+        except LiveError:
+            status = None  # The batch progress bar is already a live display
+        
+        status_cb = None
+        if status is not None:
+            spinner_tag = self._spinner_tag
+            status_cb = lambda stage: status.update(spinner_tag + stage)
+        
+        try:
+            search_output = await asyncio.wrap_future(
+                self.engine.search_future(query, status_cb=status_cb)
+            )
+        finally:
+            if status is not None:
+                status.stop()
         
         self.console.print(f"[{self.success_color}]✓[/] Search completed!\n")
+        return search_output
     
     def display_enhanced_results(self, results: List[SearchResult], total_results: int, search_time: float):
         """Display search results with beautiful formatting and layout"""
+        # 'o #' opens from the page on screen
+        self._current_results = results
+        
         if not results:
             no_results_panel = Panel(
                 Align.center(
@@ -332,50 +668,40 @@ class EnhancedConsoleInterface:
         self.console.print(stats_panel)
         self.console.print()
         
-        # Display results with enhanced formatting
+        # All results go into one table so the page is laid out in a single pass
+        results_table = Table(
+            show_header=False,
+            box=box.SIMPLE,
+            expand=True,
+            row_styles=[self.primary_color, self.secondary_color]
+        )
+        results_table.add_column(justify="right", no_wrap=True)
+        results_table.add_column(ratio=1)
+        
         for i, result in enumerate(results, 1):
-            result_num = (self.engine.current_page - 1) * len(results) + i
-            
-            # Create result panel
-            result_content = self._format_result_content(result, result_num)
-            
-            result_panel = Panel(
-                result_content,
-                title=f"🔗 Result {result_num}",
-                border_style=self.primary_color if i % 2 == 1 else self.secondary_color,
-                padding=(0, 1)
+            result_num = start_index + i - 1
+            results_table.add_row(
+                f"[bold]{result_num}[/]",
+                self._format_result_content(result, result_num),
+                end_section=True
             )
-            
-            self.console.print(result_panel)
+        
+        self.console.print(results_table)
         
         # Navigation help
         self._display_navigation_help(total_pages)
     
     def _format_result_content(self, result: SearchResult, result_num: int) -> str:
         """Format individual result content"""
-        content_parts = []
-        
-        # Title with icon based on type
-        type_icons = {
-            "webpage": "🌐",
-            "pdf": "📄",
-            "doc": "📝",
-            "news": "📰",
-            "video": "🎥",
-            "image": "🖼️"
-        }
-        
-        icon = type_icons.get(result.result_type.value, "🔗")
-        content_parts.append(f"[bold {self.primary_color}]{icon} {result.title}[/]")
-        
-        # URL
-        content_parts.append(f"[{self.secondary_color}]🔗 {result.url}[/]")
+        # Title icon based on type
+        result_type = result.result_type.value
+        icon = _TYPE_ICONS.get(result_type, "🔗")
         
         # Snippet
         snippet = result.snippet
-        if len(snippet) > self.config.display.max_snippet_length:
-            snippet = snippet[:self.config.display.max_snippet_length] + "..."
-        content_parts.append(f"[white]{snippet}[/]")
+        max_length = self._max_snippet_length
+        if len(snippet) > max_length:
+            snippet = snippet[:max_length] + "..."
         
         # Metadata with icons
         metadata_parts = []
@@ -383,40 +709,24 @@ class EnhancedConsoleInterface:
             metadata_parts.append(f"🏢 {result.source}")
         if result.date:
             metadata_parts.append(f"📅 {result.date}")
-        if result.result_type.value != "webpage":
-            metadata_parts.append(f"📋 {result.result_type.value.upper()}")
+        if result_type != "webpage":
+            metadata_parts.append(f"📋 {result_type.upper()}")
         
         if metadata_parts:
-            content_parts.append(f"[{self.muted_color}]{' • '.join(metadata_parts)}[/]")
-        
-        return "\n".join(content_parts)
+            return self._result_meta_template.format(
+                icon=icon, title=result.title, url=result.url,
+                snippet=snippet, meta=" • ".join(metadata_parts)
+            )
+        return self._result_template.format(
+            icon=icon, title=result.title, url=result.url, snippet=snippet
+        )
     
     def _display_navigation_help(self, total_pages: int):
         """Display enhanced navigation help"""
-        nav_table = Table(show_header=False, box=None)
-        nav_table.add_column(style=f"{self.accent_color} bold")
-        nav_table.add_column(style="white")
-        
-        nav_table.add_row("n, next", "→ Next page")
-        nav_table.add_row("p, prev", "← Previous page")
-        nav_table.add_row("page #", "📄 Go to page #")
-        nav_table.add_row("first", "⏮️ First page")
-        nav_table.add_row("last", "⏭️ Last page")
-        nav_table.add_row("o #", "🔗 Open result # in browser")
-        nav_table.add_row("f, filter", "🔍 Filter results")
-        nav_table.add_row("h, history", "📚 Search history")
-        nav_table.add_row("?, help", "❓ Show all commands")
-        
-        nav_panel = Panel(
-            nav_table,
-            title="⌨️  Quick Commands",
-            border_style=self.accent_color,
-            padding=(0, 1)
-        )
-        
+        nav_panel = _navigation_help_panel(self.accent_color)
         self.console.print(nav_panel)
     
-    def process_search(self, query: str):
+    async def process_search(self, query: str):
         """Process a search query with enhanced loading and display"""
         if not query.strip():
             self.console.print(Panel(
@@ -426,12 +736,9 @@ class EnhancedConsoleInterface:
             ))
             return
         
-        # Display enhanced loading animation
-        self.display_enhanced_loading(query)
-        
-        # Perform search
+        # Perform search behind the loading animation
         try:
-            results, total_results, search_time = self.engine.search(query)
+            results, total_results, search_time = await self.display_enhanced_loading(query)
             self.display_enhanced_results(results, total_results, search_time)
         except Exception as e:
             error_panel = Panel(
@@ -444,74 +751,38 @@ class EnhancedConsoleInterface:
             )
             self.console.print(error_panel)
     
-    def handle_command(self, command: str):
+    async def handle_command(self, command: str):
         """Process user commands with enhanced feedback"""
         command = command.strip().lower()
-        parts = command.split()
         
         if not command:
             return
         
-        # Check if it's a search query (not a command)
-        if not self._is_command(command):
-            self.process_search(command)
-            return
-        
-        # Process commands
-        if command in ['n', 'next']:
-            self.next_page()
-        elif command in ['p', 'prev', 'previous']:
-            self.prev_page()
-        elif command == 'first':
-            self.first_page()
-        elif command == 'last':
-            self.last_page()
-        elif command.startswith('page '):
-            if len(parts) > 1:
-                self.goto_page(parts[1])
-            else:
+        name, _, argument = command.partition(' ')
+        if not argument:
+            # Argument-free commands only match the whole input
+            handler = self._commands.get(command)
+            if handler is not None:
+                # Commands that search are coroutines
+                outcome = handler()
+                if asyncio.iscoroutine(outcome):
+                    await outcome
+                return
+            if command == 'page':
                 self._show_command_help("page", "Please specify a page number", "page 3")
-        elif command.startswith('o ') or command.startswith('open '):
-            if len(parts) > 1:
-                self.open_result(parts[1])
-            else:
+                return
+            if command in ('o', 'open'):
                 self._show_command_help("open", "Please specify a result number", "o 1")
-        elif command in ['f', 'filter', 'filters']:
-            self.show_enhanced_filters()
-        elif command in ['h', 'history']:
-            self.show_enhanced_history()
-        elif command in ['s', 'save']:
-            self.save_search()
-        elif command == 'bookmarks':
-            self.show_bookmarks()
-        elif command in ['c', 'clear']:
-            self.clear_screen()
-        elif command in ['r', 'refresh']:
-            self.refresh_search()
-        elif command in ['help', '?']:
-            self.show_enhanced_help()
-        elif command == 'stats':
-            self.show_stats()
-        elif command == 'settings':
-            self.show_settings()
-        elif command in ['exit', 'quit', 'q']:
-            self.exit_application()
-        elif command == 'back':
-            self.go_back()
-        else:
-            # Treat unknown commands as search queries
-            self.process_search(command)
-    
-    def _is_command(self, text: str) -> bool:
-        """Check if text is a command rather than a search query"""
-        commands = {
-            'n', 'next', 'p', 'prev', 'previous', 'first', 'last', 'f', 'filter', 'filters',
-            'h', 'history', 's', 'save', 'bookmarks', 'c', 'clear', 'r',
-            'refresh', 'help', '?', 'stats', 'settings', 'exit', 'quit', 'q', 'back'
-        }
+                return
+        elif name == 'page':
+            await self.goto_page(argument.split()[0])
+            return
+        elif name in ('o', 'open'):
+            self.open_result(argument.split()[0])
+            return
         
-        first_word = text.split()[0] if text.split() else text
-        return first_word in commands or first_word.startswith('o') or first_word.startswith('page')
+        # Treat anything else as a search query
+        await self.process_search(command)
     
     def _show_command_help(self, command: str, message: str, example: str):
         """Show help for a specific command"""
@@ -522,210 +793,133 @@ class EnhancedConsoleInterface:
             border_style=self.warning_color
         )
         self.console.print(help_panel)
-
-    def next_page(self):
+    
+    async def next_page(self):
         """Navigate to next page with enhanced feedback"""
-        if not self.engine.current_query:
-            self.console.print(Panel(
-                f"[{self.warning_color}]No active search to paginate[/]\n\n"
-                f"[white]Perform a search first, then use 'n' or 'next'[/]",
-                title="📄 No Active Search",
-                border_style=self.warning_color
-            ))
-            return
-            
-        if self.engine.current_page < self.engine.total_pages:
-            with Status(f"Loading page {self.engine.current_page + 1}...", console=self.console):
-                try:
-                    next_page = self.engine.current_page + 1
-                    results, total_results, search_time = self.engine.search(
-                        self.engine.current_query, next_page, self.engine.current_filters
-                    )
-                    self.display_enhanced_results(results, total_results, search_time)
-                except Exception as e:
-                    self.console.print(Panel(
-                        f"[{self.error_color}]Failed to load next page: {str(e)}[/]",
-                        title="❌ Pagination Error",
-                        border_style=self.error_color
-                    ))
-        else:
-            self.console.print(Panel(
-                f"[{self.warning_color}]You're already on the last page ({self.engine.current_page})[/]",
-                title="📄 Last Page",
-                border_style=self.warning_color
-            ))
+        await self._goto('next')
     
-    def prev_page(self):
+    async def prev_page(self):
         """Navigate to previous page with enhanced feedback"""
-        if not self.engine.current_query:
-            self.console.print(Panel(
-                f"[{self.warning_color}]No active search to paginate[/]\n\n"
-                f"[white]Perform a search first, then use 'p' or 'prev'[/]",
-                title="📄 No Active Search",
-                border_style=self.warning_color
-            ))
-            return
-            
-        if self.engine.current_page > 1:
-            with Status(f"Loading page {self.engine.current_page - 1}...", console=self.console):
-                try:
-                    prev_page = self.engine.current_page - 1
-                    results, total_results, search_time = self.engine.search(
-                        self.engine.current_query, prev_page, self.engine.current_filters
-                    )
-                    self.display_enhanced_results(results, total_results, search_time)
-                except Exception as e:
-                    self.console.print(Panel(
-                        f"[{self.error_color}]Failed to load previous page: {str(e)}[/]",
-                        title="❌ Pagination Error",
-                        border_style=self.error_color
-                    ))
-        else:
-            self.console.print(Panel(
-                f"[{self.warning_color}]You're already on the first page[/]",
-                title="📄 First Page",
-                border_style=self.warning_color
-            ))
+        await self._goto('prev')
     
-    def first_page(self):
+    async def first_page(self):
         """Navigate to first page with enhanced feedback"""
-        if not self.engine.current_query:
-            self.console.print(Panel(
-                f"[{self.warning_color}]No active search to paginate[/]\n\n"
-                f"[white]Perform a search first, then use 'first'[/]",
-                title="📄 No Active Search",
-                border_style=self.warning_color
-            ))
-            return
-            
-        if self.engine.current_page == 1:
-            self.console.print(Panel(
-                f"[{self.warning_color}]You're already on the first page[/]",
-                title="📄 Already First Page",
-                border_style=self.warning_color
-            ))
-            return
-            
-        with Status("Loading first page...", console=self.console):
-            try:
-                results, total_results, search_time = self.engine.search(
-                    self.engine.current_query, 1, self.engine.current_filters
-                )
-                self.display_enhanced_results(results, total_results, search_time)
-            except Exception as e:
-                self.console.print(Panel(
-                    f"[{self.error_color}]Failed to load first page: {str(e)}[/]",
-                    title="❌ Pagination Error",
-                    border_style=self.error_color
-                ))
+        await self._goto('first')
     
-    def last_page(self):
+    async def last_page(self):
         """Navigate to last page with enhanced feedback"""
-        if not self.engine.current_query:
-            self.console.print(Panel(
-                f"[{self.warning_color}]No active search to paginate[/]\n\n"
-                f"[white]Perform a search first, then use 'last'[/]",
-                title="📄 No Active Search",
-                border_style=self.warning_color
-            ))
-            return
-            
-        if self.engine.total_pages == 0:
-            self.console.print(Panel(
-                f"[{self.warning_color}]No pages available[/]",
-                title="📄 No Pages",
-                border_style=self.warning_color
-            ))
-            return
-            
-        if self.engine.current_page == self.engine.total_pages:
-            self.console.print(Panel(
-                f"[{self.warning_color}]You're already on the last page[/]",
-                title="📄 Already Last Page",
-                border_style=self.warning_color
-            ))
-            return
-            
-        with Status(f"Loading last page ({self.engine.total_pages})...", console=self.console):
-            try:
-                results, total_results, search_time = self.engine.search(
-                    self.engine.current_query, self.engine.total_pages, self.engine.current_filters
-                )
-                self.display_enhanced_results(results, total_results, search_time)
-            except Exception as e:
-                self.console.print(Panel(
-                    f"[{self.error_color}]Failed to load last page: {str(e)}[/]",
-                    title="❌ Pagination Error",
-                    border_style=self.error_color
-                ))
+        await self._goto('last')
     
-    def goto_page(self, page_str: str):
+    async def goto_page(self, page_str: str):
         """Navigate to a specific page"""
+        try:
+            page_num: Optional[int] = int(page_str)
+        except ValueError:
+            page_num = None
+        await self._goto('page', page_num)
+    
+    async def _goto(self, which: str, page_num: Optional[int] = None):
+        """
+        Validate and load the page a navigation command asks for
+        
+        which is 'next', 'prev', 'first', 'last' or 'page'; for 'page',
+        page_num is the requested page, or None if it was not a number.
+        """
         if not self.engine.current_query:
-            self.console.print(Panel(
-                f"[{self.warning_color}]No active search to paginate[/]\n\n"
-                f"[white]Perform a search first, then use 'page #'[/]",
-                title="📄 No Active Search",
-                border_style=self.warning_color
-            ))
+            self.console.print(_no_search_panel(self.warning_color, _NAV_USAGE[which]))
             return
-            
-        try:
-            page_num = int(page_str)
-            
-            if page_num < 1:
-                self.console.print(Panel(
-                    f"[{self.error_color}]Page number must be 1 or greater[/]",
-                    title="❌ Invalid Page",
-                    border_style=self.error_color
-                ))
+        
+        current_page = self.engine.current_page
+        total_pages = self.engine.total_pages
+        
+        if which == 'next':
+            if current_page >= total_pages:
+                self._nav_notice("📄 Last Page", f"You're already on the last page ({current_page})")
                 return
-                
-            if page_num > self.engine.total_pages:
-                self.console.print(Panel(
-                    f"[{self.error_color}]Page {page_num} doesn't exist[/]\n\n"
-                    f"[white]Maximum page is {self.engine.total_pages}[/]",
-                    title="❌ Page Not Found",
-                    border_style=self.error_color
-                ))
+            target = current_page + 1
+            await self._load_page(target, f"Loading page {target}...", "next page")
+        
+        elif which == 'prev':
+            if current_page <= 1:
+                self._nav_notice("📄 First Page", "You're already on the first page")
                 return
-                
-            if page_num == self.engine.current_page:
-                self.console.print(Panel(
-                    f"[{self.warning_color}]You're already on page {page_num}[/]",
-                    title="📄 Same Page",
-                    border_style=self.warning_color
-                ))
+            target = current_page - 1
+            await self._load_page(target, f"Loading page {target}...", "previous page")
+        
+        elif which == 'first':
+            if current_page == 1:
+                self._nav_notice("📄 Already First Page", "You're already on the first page")
                 return
-                
-            with Status(f"Loading page {page_num}...", console=self.console):
-                try:
-                    results, total_results, search_time = self.engine.search(
-                        self.engine.current_query, page_num, self.engine.current_filters
-                    )
-                    self.display_enhanced_results(results, total_results, search_time)
-                except Exception as e:
-                    self.console.print(Panel(
-                        f"[{self.error_color}]Failed to load page {page_num}: {str(e)}[/]",
-                        title="❌ Pagination Error",
-                        border_style=self.error_color
-                    ))
-                    
-        except ValueError:
+            await self._load_page(1, "Loading first page...", "first page")
+        
+        elif which == 'last':
+            if total_pages == 0:
+                self._nav_notice("📄 No Pages", "No pages available")
+                return
+            if current_page == total_pages:
+                self._nav_notice("📄 Already Last Page", "You're already on the last page")
+                return
+            await self._load_page(total_pages, f"Loading last page ({total_pages})...", "last page")
+        
+        elif page_num is None:
+            self._nav_notice(
+                "❌ Invalid Input", "Please enter a valid page number",
+                self.error_color, "Example: page 3"
+            )
+        elif page_num < 1:
+            self._nav_notice("❌ Invalid Page", "Page number must be 1 or greater", self.error_color)
+        elif page_num > total_pages:
+            self._nav_notice(
+                "❌ Page Not Found", f"Page {page_num} doesn't exist",
+                self.error_color, f"Maximum page is {total_pages}"
+            )
+        elif page_num == current_page:
+            self._nav_notice("📄 Same Page", f"You're already on page {page_num}")
+        else:
+            await self._load_page(page_num, f"Loading page {page_num}...", f"page {page_num}")
+    
+    def _nav_notice(self, title: str, message: str, color: Optional[str] = None, detail: Optional[str] = None):
+        """Show why a navigation command did nothing"""
+        color = color or self.warning_color
+        content = f"[{color}]{message}[/]"
+        if detail:
+            content += f"\n\n[white]{detail}[/]"
+        self.console.print(Panel(content, title=title, border_style=color))
+    
+    async def _load_page(self, page: int, message: str, description: str):
+        """Search the current query's page behind the shared navigation spinner"""
+        status: Optional[Status]
+        status = self._nav_status
+        status.update(message)
+        try:
+            status.start()
+        except LiveError:
+            status = None
+        try:
+            results, total_results, search_time = await asyncio.wrap_future(
+                self.engine.search_future(
+                    self.engine.current_query, page, self.engine.current_filters
+                )
+            )
+            self.display_enhanced_results(results, total_results, search_time)
+        except Exception as e:
             self.console.print(Panel(
-                f"[{self.error_color}]Please enter a valid page number[/]\n\n"
-                f"[white]Example: page 3[/]",
-                title="❌ Invalid Input",
+                f"[{self.error_color}]Failed to load {description}: {str(e)}[/]",
+                title="❌ Pagination Error",
                 border_style=self.error_color
             ))
+        finally:
+            if status is not None:
+                status.stop()
     
     def open_result(self, result_num: str):
         """Open a result with enhanced feedback"""
         try:
             num = int(result_num)
-            current_results = self.engine.get_current_results()[0]
+            current_results = self._current_results
+            result_count = len(current_results)
             
-            if 1 <= num <= len(current_results):
+            if 1 <= num <= result_count:
                 result = current_results[num - 1]
                 
                 self.console.print(Panel(
@@ -736,12 +930,17 @@ class EnhancedConsoleInterface:
                     border_style=self.success_color
                 ))
                 
+                # Launching the browser can block on xdg-open, so it runs
+                # off the input loop
                 import webbrowser
-                webbrowser.open(result.url)
+                threading.Thread(
+                    target=webbrowser.open, args=(result.url,),
+                    name="searchengine-open-url", daemon=True
+                ).start()
             else:
                 self.console.print(Panel(
                     f"[{self.error_color}]Invalid result number: {num}[/]\n\n"
-                    f"[white]Please choose a number between 1 and {len(current_results)}[/]",
+                    f"[white]Please choose a number between 1 and {result_count}[/]",
                     title="❌ Invalid Number",
                     border_style=self.error_color
                 ))
@@ -755,33 +954,11 @@ class EnhancedConsoleInterface:
     
     def show_enhanced_filters(self):
         """Show enhanced filters interface"""
-        filters_table = Table(title="🔍 Available Search Filters", show_header=True)
-        filters_table.add_column("Operator", style=f"{self.primary_color} bold")
-        filters_table.add_column("Description", style="white")
-        filters_table.add_column("Example", style=f"{self.muted_color} italic")
-        
-        filters_data = [
-            ("site:", "Search within specific website", "site:github.com python"),
-            ("filetype:", "Search for specific file types", "filetype:pdf machine learning"),
-            ('"quotes"', "Search for exact phrase", '"machine learning tutorial"'),
-            ("+required", "Require specific word", "+python tutorial"),
-            ("-exclude", "Exclude specific word", "python -java"),
-            ("OR", "Search for either term", "python OR javascript"),
-            ("*", "Wildcard for unknown words", "how to * python"),
-        ]
-        
-        for operator, description, example in filters_data:
-            filters_table.add_row(operator, description, example)
-        
-        self.console.print(Panel(
-            filters_table,
-            border_style=self.primary_color,
-            padding=(1, 2)
-        ))
+        self.console.print(_filters_table(self.primary_color, self.muted_color))
     
     def show_enhanced_history(self):
         """Show enhanced search history"""
-        history = self.engine.get_search_history()
+        history = self.engine.get_search_history(_HISTORY_DISPLAY_LIMIT)
         
         if not history:
             self.console.print(Panel(
@@ -792,135 +969,46 @@ class EnhancedConsoleInterface:
             ))
             return
         
-        history_table = Table(title="📚 Recent Searches", show_header=True)
-        history_table.add_column("#", style=f"{self.muted_color}")
-        history_table.add_column("Query", style=f"{self.primary_color} bold")
-        history_table.add_column("Results", style=f"{self.success_color}")
-        history_table.add_column("Time", style=f"{self.muted_color}")
+        history_table = Table(
+            title="📚 Recent Searches", show_header=True,
+            box=box.ROUNDED, border_style=self.primary_color
+        )
+        for header in ("#", "Query", "Results", "Time"):
+            history_table.add_column(header)
         
-        for i, entry in enumerate(history[-10:], 1):  # Show last 10
+        # Cells are Text so queries are not parsed as markup
+        index_style, query_style, count_style, time_style = self._history_styles
+        for i, entry in enumerate(history, 1):
             history_table.add_row(
-                str(i),
-                entry.get('query', 'Unknown'),
-                str(entry.get('results_count', 0)),
-                entry.get('timestamp', 'Unknown')
+                Text(str(i), style=index_style),
+                Text(entry.query, style=query_style),
+                Text(str(entry.results_count), style=count_style),
+                Text(
+                    entry.timestamp.strftime("%Y-%m-%d %H:%M") if entry.timestamp else "Unknown",
+                    style=time_style
+                )
             )
         
-        self.console.print(Panel(
-            history_table,
-            border_style=self.primary_color,
-            padding=(1, 2)
-        ))
+        self.console.print(history_table)
     
     def show_enhanced_help(self):
         """Show comprehensive help with beautiful formatting"""
-        help_layout = Layout()
-        
-        # Search commands
-        search_table = Table(title="🔍 Search Commands", show_header=False)
-        search_table.add_column(style=f"{self.primary_color} bold", width=15)
-        search_table.add_column(style="white")
-        
-        search_commands = [
-            ("Basic Search", "Type any query to search"),
-            ("Site Search", "site:example.com query"),
-            ("File Type", "filetype:pdf query"),
-            ("Exact Phrase", '"exact phrase"'),
-            ("Exclude Words", "query -unwanted"),
-            ("Required Words", "query +required"),
-        ]
-        
-        for command, description in search_commands:
-            search_table.add_row(command, description)
-        
-        # Navigation commands
-        nav_table = Table(title="🧭 Navigation Commands", show_header=False)
-        nav_table.add_column(style=f"{self.secondary_color} bold", width=15)
-        nav_table.add_column(style="white")
-        
-        nav_commands = [
-            ("n, next", "Go to next page"),
-            ("p, prev", "Go to previous page"),
-            ("page #", "Go to specific page"),
-            ("first", "Go to first page"),
-            ("last", "Go to last page"),
-            ("o #", "Open result # in browser"),
-            ("back", "Go back to previous view"),
-        ]
-        
-        for command, description in nav_commands:
-            nav_table.add_row(command, description)
-        
-        # Tool commands
-        tools_table = Table(title="🛠️ Tool Commands", show_header=False)
-        tools_table.add_column(style=f"{self.accent_color} bold", width=15)
-        tools_table.add_column(style="white")
-        
-        tool_commands = [
-            ("f, filter", "Show search filters"),
-            ("h, history", "Show search history"),
-            ("s, save", "Save current search"),
-            ("bookmarks", "Show saved bookmarks"),
-            ("stats", "Show search statistics"),
-            ("settings", "Show settings"),
-        ]
-        
-        for command, description in tool_commands:
-            tools_table.add_row(command, description)
-        
-        # System commands
-        system_table = Table(title="⚙️ System Commands", show_header=False)
-        system_table.add_column(style=f"{self.error_color} bold", width=15)
-        system_table.add_column(style="white")
-        
-        system_commands = [
-            ("c, clear", "Clear screen"),
-            ("r, refresh", "Refresh current results"),
-            ("?, help", "Show this help"),
-            ("exit, quit", "Exit application"),
-        ]
-        
-        for command, description in system_commands:
-            system_table.add_row(command, description)
-        
-        # Create columns layout
-        help_columns = Columns([
-            Panel(search_table, border_style=self.primary_color),
-            Panel(nav_table, border_style=self.secondary_color),
-        ])
-        
-        help_columns2 = Columns([
-            Panel(tools_table, border_style=self.accent_color),
-            Panel(system_table, border_style=self.error_color),
-        ])
-        
-        self.console.print(Panel(
-            f"[bold {self.primary_color}]SearchEngine Pro v3.2 - Help Guide[/]\n\n"
-            f"Welcome to the enhanced interactive search engine! 🚀",
-            title="❓ Help",
-            border_style=self.primary_color,
-            padding=(1, 2)
-        ))
-        
-        self.console.print(help_columns)
-        self.console.print(help_columns2)
-        
-        self.console.print(Panel(
-            f"[{self.success_color}]💡 Pro Tips:[/]\n"
-            f"• Use quotes for exact phrases: \"machine learning\"\n"
-            f"• Combine operators: site:github.com \"python tutorial\"\n"
-            f"• Press Tab for command autocomplete (if available)\n"
-            f"• Use Ctrl+C to interrupt long operations",
-            title="✨ Pro Tips",
-            border_style=self.success_color
+        # Piped output and narrow terminals get the single-table layout
+        compact = not self.console.is_terminal or self.console.width < _HELP_COLUMNS_MIN_WIDTH
+        self.console.print(_help_screen(
+            self.primary_color, self.secondary_color, self.accent_color,
+            self.success_color, self.error_color, compact
         ))
     
     def show_stats(self):
         """Show enhanced search statistics"""
         stats = self.engine.get_session_stats()
         
-        stats_table = Table(title="📊 Session Statistics", show_header=False)
-        stats_table.add_column(style=f"{self.primary_color} bold", width=20)
+        stats_table = Table(
+            title="📊 Session Statistics", show_header=False,
+            box=box.ROUNDED, border_style=self.primary_color
+        )
+        stats_table.add_column(style=self._primary_bold, width=20)
         stats_table.add_column(style="white")
         
         stats_data = [
@@ -935,35 +1023,20 @@ class EnhancedConsoleInterface:
         for label, value in stats_data:
             stats_table.add_row(label, value)
         
-        self.console.print(Panel(
-            stats_table,
-            border_style=self.primary_color,
-            padding=(1, 2)
-        ))
+        self.console.print(stats_table)
     
     def show_settings(self):
         """Show current settings"""
-        settings_table = Table(title="⚙️ Current Settings", show_header=False)
-        settings_table.add_column(style=f"{self.accent_color} bold", width=25)
-        settings_table.add_column(style="white")
-        
-        settings_data = [
+        settings_data = (
             ("🎨 Colors Enabled", "Yes" if self.config.display.colors else "No"),
             ("✨ Animations Enabled", "Yes" if self.config.display.animations else "No"),
             ("📄 Results Per Page", str(self.config.search.results_per_page)),
             ("🔍 Search Provider", self.config.api.default_provider),
             ("💾 Cache Enabled", "Yes" if self.config.cache.enabled else "No"),
             ("📚 History Enabled", "Yes" if self.config.history.save_to_file else "No"),
-        ]
-        
-        for label, value in settings_data:
-            settings_table.add_row(label, value)
-        
-        self.console.print(Panel(
-            settings_table,
-            border_style=self.accent_color,
-            padding=(1, 2)
-        ))
+        )
+        # Rebuilt only when one of the displayed settings changes
+        self.console.print(_settings_table(self.accent_color, settings_data))
     
     def save_search(self):
         """Save current search with enhanced interface"""
@@ -980,7 +1053,7 @@ class EnhancedConsoleInterface:
         save_panel = Panel(
             f"[{self.success_color}]✅ Search saved to history![/]\n\n"
             f"[white]Query: [bold]{self.engine.last_query}[/]\n"
-            f"Results: {len(self.engine.get_current_results()[0]) if self.engine.get_current_results()[0] else 0}[/]",
+            f"Results: {len(self.engine.current_results)}[/]",
             title="💾 Search Saved",
             border_style=self.success_color
         )
@@ -1005,7 +1078,7 @@ class EnhancedConsoleInterface:
             padding=(0, 1)
         ))
     
-    def refresh_search(self):
+    async def refresh_search(self):
         """Refresh current search with enhanced feedback"""
         if hasattr(self.engine, 'last_query') and self.engine.last_query:
             self.console.print(Panel(
@@ -1013,7 +1086,7 @@ class EnhancedConsoleInterface:
                 title="🔄 Refresh",
                 border_style=self.primary_color
             ))
-            self.process_search(self.engine.last_query)
+            await self.process_search(self.engine.last_query)
         else:
             self.console.print(Panel(
                 f"[{self.warning_color}]No previous search to refresh[/]\n\n"
@@ -1033,6 +1106,8 @@ class EnhancedConsoleInterface:
     
     def exit_application(self):
         """Enhanced exit with confirmation"""
+        from rich.prompt import Confirm
+        
         if Confirm.ask(f"[{self.warning_color}]Are you sure you want to exit?[/]"):
             self.running = False
         else:
@@ -5,14 +5,29 @@ This module contains utility functions and classes for configuration,
 caching, helpers, and other supporting functionality.
 """
 
-from .config import Config
-from .cache import CacheManager
-from .helpers import setup_logging, format_duration, sanitize_filename
+from typing import TYPE_CHECKING
+
+from .helpers import lazy_exports, setup_logging, format_duration, sanitize_filename
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .cache import CacheManager, LRUCache
+
+# helpers is imported eagerly since the other packages need lazy_exports;
+# config and cache load on first attribute access
+_LAZY_EXPORTS = {
+    "Config": ".config",
+    "CacheManager": ".cache",
+    "LRUCache": ".cache",
+}
 
 __all__ = [
     "Config",
-    "CacheManager", 
+    "CacheManager",
+    "LRUCache",
     "setup_logging",
     "format_duration",
     "sanitize_filename",
-] 
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
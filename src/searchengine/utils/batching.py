@@ -0,0 +1,124 @@
+"""
+SearchEngine Pro - Async Batching
+
+Micro-batching helper that collects requests arriving within a short
+window and hands them to a single batch handler.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, List, Optional, Sequence, Set, Tuple, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncBatcher(Generic[T, R]):
+    """
+    Collects submitted items and processes them in batches.
+    
+    A batch is dispatched when it reaches max_batch items or when the
+    collection window expires. The window adapts to the load: it shrinks
+    while batches contain a single item (so an idle system pays no extra
+    latency) and grows back towards max_wait_ms when requests overlap.
+    
+    The handler receives a list of items and must return a list of results
+    in the same order. An exception instance in the result list fails only
+    the corresponding caller; an exception raised by the handler fails the
+    whole batch.
+    """
+    
+    def __init__(
+        self,
+        process_batch: Callable[[List[T]], Awaitable[Sequence[Union[R, BaseException]]]],
+        max_batch: int = 8,
+        max_wait_ms: float = 20.0
+    ):
+        self.process_batch = process_batch
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._wait = self.max_wait
+        self._pending: List[Tuple[T, "asyncio.Future"]] = []
+        self._timer: Optional[asyncio.Handle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set["asyncio.Task"] = set()
+    
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for its result"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Pending state from another loop can never complete here
+            self._reset(loop)
+        
+        future = loop.create_future()
+        self._pending.append((item, future))
+        
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            if self._wait <= 0:
+                self._timer = loop.call_soon(self._flush)
+            else:
+                self._timer = loop.call_later(self._wait, self._flush)
+        
+        return await future
+    
+    def _reset(self, loop: asyncio.AbstractEventLoop):
+        """Bind the batcher to a new event loop"""
+        self._loop = loop
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+        self._wait = self.max_wait
+    
+    def _flush(self):
+        """Dispatch the pending items as one batch"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch = self._pending[:self.max_batch]
+        self._pending = self._pending[self.max_batch:]
+        if not batch:
+            return
+        
+        self._adapt(len(batch))
+        
+        task = self._loop.create_task(self._run(batch))
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        
+        if self._pending:
+            self._timer = self._loop.call_soon(self._flush)
+    
+    def _adapt(self, batch_size: int):
+        """Adjust the collection window based on the last batch size"""
+        if batch_size <= 1:
+            self._wait = self._wait / 2 if self._wait > 0.001 else 0.0
+        else:
+            self._wait = min(self.max_wait, max(self._wait * 2, 0.001))
+    
+    async def _run(self, batch: List[Tuple[T, "asyncio.Future"]]):
+        """Run the batch handler and scatter results to the callers"""
+        items = [item for item, _ in batch]
+        results: Sequence[Union[R, BaseException]]
+        try:
+            results = await self.process_batch(items)
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch handler returned {len(results)} results for {len(batch)} items"
+                )
+        except Exception as e:
+            logger.debug(f"Batch of {len(batch)} failed: {e}")
+            results = [e] * len(batch)
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -1,84 +1,136 @@
 """
 SearchEngine Pro - Cache Manager
 
-Simple in-memory cache for search results with TTL support.
+Simple in-memory cache for search results with TTL support, plus a
+persistent SQLite cache for fetched page metadata.
 """
 
+import asyncio
+import sqlite3
 import time
 import logging
-from typing import Any, Optional, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional, Dict, Hashable, Tuple
 from dataclasses import dataclass
 
 from .config import Config
+from . import serialization
+from .helpers import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+# Seconds fetched metadata is buffered before being written in the background
+_METADATA_FLUSH_DELAY = 0.5
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class CacheEntry:
-    """Cache entry with TTL"""
+    """Cache entry that is fresh until expires_at on the time.monotonic() clock"""
     data: Any
-    timestamp: float
-    ttl: int
+    expires_at: float
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with a per-entry TTL"""
+    
+    def __init__(self, max_size: int = 1024, ttl: int = 600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get cached value, refreshing its recency"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.data
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None):
+        """Set cached value, evicting the least recently used entry if full"""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._entries[key] = CacheEntry(
+            data=value,
+            expires_at=time.monotonic() + (self.ttl if ttl is None else ttl)
+        )
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop a single entry, or the whole cache when no key is given"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+    
+    def purge_expired(self):
+        """Remove every expired entry"""
+        now = time.monotonic()
+        expired_keys = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired_keys:
+            del self._entries[key]
+    
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics"""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class CacheManager:
-    """Simple in-memory cache manager"""
+    """Simple in-memory cache manager with least-recently-used eviction"""
     
     def __init__(self, config: Config):
         self.config = config
-        self.cache: Dict[str, CacheEntry] = {}
-        self.max_size = config.cache.max_size
+        self.cache = LRUCache(max_size=config.cache.max_size, ttl=3600)
         self.enabled = config.cache.enabled
+        self.cleanup_interval = config.cache.cleanup_interval
+        self._last_cleanup = time.monotonic()
+    
+    @property
+    def max_size(self) -> int:
+        """Maximum number of cached entries"""
+        return self.cache.max_size
     
     async def get(self, key: str) -> Optional[Any]:
         """Get cached value"""
         if not self.enabled:
             return None
-            
-        if key in self.cache:
-            entry = self.cache[key]
-            if time.time() - entry.timestamp < entry.ttl:
-                return entry.data
-            else:
-                del self.cache[key]
-        
-        return None
+        return self.cache.get(key)
     
     async def set(self, key: str, value: Any, ttl: int = 3600):
         """Set cached value"""
         if not self.enabled:
             return
-            
-        # Clean up if cache is full
-        if len(self.cache) >= self.max_size:
-            self._cleanup_old_entries()
-        
-        self.cache[key] = CacheEntry(
-            data=value,
-            timestamp=time.time(),
-            ttl=ttl
-        )
-    
-    def _cleanup_old_entries(self):
-        """Remove old cache entries"""
-        current_time = time.time()
-        expired_keys = [
-            key for key, entry in self.cache.items()
-            if current_time - entry.timestamp >= entry.ttl
-        ]
-        
-        for key in expired_keys:
-            del self.cache[key]
         
-        # If still too large, remove oldest entries
         if len(self.cache) >= self.max_size:
-            sorted_items = sorted(
-                self.cache.items(),
-                key=lambda x: x[1].timestamp
-            )
-            for key, _ in sorted_items[:len(self.cache) - self.max_size + 1]:
-                del self.cache[key]
+            # Sweep out expired entries at most once per cleanup interval
+            # before the cache falls back to dropping the least recently used
+            now = time.monotonic()
+            if now - self._last_cleanup >= self.cleanup_interval:
+                self.cache.purge_expired()
+                self._last_cleanup = now
+        
+        self.cache.set(key, value, ttl)
     
     def get_cache_size(self) -> int:
         """Get current cache size"""
@@ -86,4 +138,133 @@ class CacheManager:
     
     async def close(self):
         """Cleanup resources"""
-        self.cache.clear() 
\ No newline at end of file
+        self.cache.invalidate()
+
+
+class MetadataCache:
+    """
+    Persistent URL -> metadata cache backed by SQLite
+    
+    All database work runs on a single worker thread, off the event loop.
+    Writes are buffered and committed together in the background.
+    """
+    
+    def __init__(self, config: Config, db_path: Optional[Path] = None):
+        self.ttl = config.cache.metadata_ttl
+        self.enabled = config.cache.enabled
+        self.db_path = db_path or config.cache_dir / "metadata.db"
+        self._conn: Optional[sqlite3.Connection] = None
+        # One worker, so the connection is only ever used by one thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metadata-cache")
+        # Metadata waiting to be written, with the time it was stored
+        self._pending: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use"""
+        if self._conn is None and self.enabled:
+            try:
+                conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS metadata ("
+                    "url TEXT PRIMARY KEY, data BLOB NOT NULL, timestamp REAL NOT NULL)"
+                )
+                # Drop anything that expired since the last run
+                conn.execute("DELETE FROM metadata WHERE timestamp < ?", (time.time() - self.ttl,))
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"Metadata cache unavailable ({self.db_path}): {e}")
+                self.enabled = False
+        return self._conn
+    
+    async def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get cached metadata for a URL if it is still fresh"""
+        pending = self._pending.get(url)
+        if pending is not None:
+            return pending[0]
+        if not self.enabled:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._read, url)
+    
+    def _read(self, url: str) -> Optional[Dict[str, Any]]:
+        """Look a URL up in the database"""
+        conn = self._connect()
+        if conn is None:
+            return None
+        
+        try:
+            row = conn.execute(
+                "SELECT data, timestamp FROM metadata WHERE url = ?", (url,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Metadata cache read failed for {url}: {e}")
+            return None
+        
+        if row is None or time.time() - row[1] >= self.ttl:
+            return None
+        return serialization.loads(row[0])
+    
+    def set(self, url: str, metadata: Dict[str, Any]):
+        """Store metadata for a URL, written to the database shortly after"""
+        if not self.enabled:
+            return
+        
+        self._pending[url] = (metadata, time.time())
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+    
+    async def _flush_later(self):
+        """Write buffered metadata after a short delay, off the event loop"""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                await asyncio.sleep(_METADATA_FLUSH_DELAY)
+                batch, self._pending = self._pending, {}
+                await loop.run_in_executor(self._executor, self._write, batch)
+        finally:
+            self._flush_task = None
+    
+    def _write(self, batch: Dict[str, Tuple[Dict[str, Any], float]]):
+        """Insert a batch of metadata in one transaction"""
+        conn = self._connect()
+        if conn is None:
+            return
+        
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO metadata (url, data, timestamp) VALUES (?, ?, ?)",
+                [
+                    (url, serialization.dumps(metadata), stored_at)
+                    for url, (metadata, stored_at) in batch.items()
+                ]
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Metadata cache write of {len(batch)} entries failed: {e}")
+    
+    def _close_connection(self):
+        """Close the database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    async def close(self):
+        """Write any buffered metadata and close the database connection"""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        
+        loop = asyncio.get_running_loop()
+        if self._pending:
+            batch, self._pending = self._pending, {}
+            await loop.run_in_executor(self._executor, self._write, batch)
+        await loop.run_in_executor(self._executor, self._close_connection)
+        self._executor.shutdown(wait=False)
@@ -7,16 +7,36 @@ from files and environment variables.
 
 import os
 import json
-import yaml
+import marshal
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+from dataclasses import dataclass, field, fields
 import logging
 
+from .helpers import DATACLASS_SLOTS
+
 logger = logging.getLogger(__name__)
 
+# JSON parses far faster than YAML, so the app writes its own config as JSON
+_DEFAULT_CONFIG_FILE = "config.json"
+_LEGACY_CONFIG_FILE = "config.yaml"
+
+# Parsed config file data, keyed by the source file's path, mtime and size
+_PARSED_CACHE_FILE = "config.marshal"
+# The same records kept in memory per path; each load unmarshals a fresh
+# copy, so Config instances never share the nested dicts
+_parsed_memo: Dict[str, bytes] = {}
+
+
+def _can_create_dir(path: Path) -> bool:
+    """Check whether a directory exists writable or could be created, without creating it"""
+    for candidate in (path, *path.parents):
+        if candidate.exists():
+            return candidate.is_dir() and os.access(candidate, os.W_OK)
+    return False
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SearchConfig:
     """Search-related configuration"""
     results_per_page: int = 10
@@ -24,9 +44,11 @@ class SearchConfig:
     max_retries: int = 3
     user_agent: str = "SearchEngine Pro/3.2"
     request_delay: float = 0.5
+    max_concurrent_requests: int = 8
+    simulate_latency: bool = False  # Add artificial delays to simulated responses
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DisplayConfig:
     """Display-related configuration"""
     colors: bool = True
@@ -36,16 +58,17 @@ class DisplayConfig:
     show_metadata: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CacheConfig:
     """Cache-related configuration"""
     enabled: bool = True
     search_ttl: int = 3600  # 1 hour
     max_size: int = 1000
     cleanup_interval: int = 300  # 5 minutes
+    metadata_ttl: int = 86400  # 24 hours
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HistoryConfig:
     """History-related configuration"""
     max_entries: int = 1000
@@ -53,7 +76,7 @@ class HistoryConfig:
     auto_cleanup_days: int = 30
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class APIConfig:
     """API-related configuration"""
     providers: Dict[str, Dict[str, Any]] = field(default_factory=dict)
@@ -62,6 +85,30 @@ class APIConfig:
     rate_limits: Dict[str, int] = field(default_factory=dict)
 
 
+# Field names of each config section, in the shape of the config file
+_SECTION_FIELDS: Dict[str, Tuple[str, ...]] = {
+    section: tuple(f.name for f in fields(section_class))
+    for section, section_class in (
+        ('search', SearchConfig),
+        ('display', DisplayConfig),
+        ('cache', CacheConfig),
+        ('history', HistoryConfig),
+        ('api', APIConfig),
+    )
+}
+
+# Environment variable -> (section, field, conversion of the raw value)
+_ENV_SETTINGS: Dict[str, Tuple[str, str, Callable[[str], Any]]] = {
+    'SEARCHENGINE_RESULTS_PER_PAGE': ('search', 'results_per_page', int),
+    'SEARCHENGINE_TIMEOUT': ('search', 'default_timeout', int),
+    'SEARCHENGINE_USER_AGENT': ('search', 'user_agent', str),
+    # Flag variables switch a feature off whatever their value
+    'SEARCHENGINE_NO_COLORS': ('display', 'colors', lambda value: False),
+    'SEARCHENGINE_NO_ANIMATIONS': ('display', 'animations', lambda value: False),
+    'SEARCHENGINE_DEFAULT_PROVIDER': ('api', 'default_provider', str),
+}
+
+
 class Config:
     """
     Main configuration class that loads and manages all settings
@@ -74,36 +121,45 @@ class Config:
         self.history = HistoryConfig()
         self.api = APIConfig()
         
+        self._use_parsed_cache = False
+        
         # Paths
         self.config_dir = self._get_config_dir()
         self.data_dir = self._get_data_dir()
         self.cache_dir = self._get_cache_dir()
         
         # Create directories
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for directory in (self.config_dir, self.data_dir, self.cache_dir):
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
     
     @classmethod
-    def load(cls, config_path: Optional[Path] = None) -> "Config":
+    def load(cls, config_path: Optional[Path] = None, use_cache: bool = True) -> "Config":
         """
         Load configuration from file or create default
         
         Args:
             config_path: Optional path to config file
-            
+            use_cache: Reuse the parsed file from memory or the cache
+                directory while the file is unchanged
+        
         Returns:
             Config instance
         """
         config = cls()
+        config._use_parsed_cache = use_cache
         
         if config_path:
             config._load_from_file(config_path)
         else:
-            # Try to load from default locations
-            default_config_file = config.config_dir / "config.yaml"
+            # Try to load from default locations; config.yaml is still read
+            # for setups created before the default switched to JSON
+            default_config_file = config.config_dir / _DEFAULT_CONFIG_FILE
+            legacy_config_file = config.config_dir / _LEGACY_CONFIG_FILE
             if default_config_file.exists():
                 config._load_from_file(default_config_file)
+            elif legacy_config_file.exists():
+                config._load_from_file(legacy_config_file)
             else:
                 # Create default config file
                 config._save_default_config(default_config_file)
@@ -120,12 +176,10 @@ class Config:
         else:  # Unix-like
             # Try XDG_CONFIG_HOME first, then fall back to .searchengine in home
             xdg_config = Path(os.environ.get('XDG_CONFIG_HOME', Path.home() / '.config'))
-            try:
-                # Test if we can write to the XDG config directory
-                test_dir = xdg_config / 'searchengine'
-                test_dir.mkdir(parents=True, exist_ok=True)
+            # Use the XDG config directory if we can write to it
+            if _can_create_dir(xdg_config / 'searchengine'):
                 base_dir = xdg_config
-            except (PermissionError, OSError):
+            else:
                 # Fall back to .searchengine in home directory
                 base_dir = Path.home()
                 return base_dir / '.searchengine'
@@ -138,12 +192,10 @@ class Config:
             base_dir = Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData/Local'))
         else:  # Unix-like
             xdg_data = Path(os.environ.get('XDG_DATA_HOME', Path.home() / '.local/share'))
-            try:
-                # Test if we can write to the XDG data directory
-                test_dir = xdg_data / 'searchengine'
-                test_dir.mkdir(parents=True, exist_ok=True)
+            # Use the XDG data directory if we can write to it
+            if _can_create_dir(xdg_data / 'searchengine'):
                 base_dir = xdg_data
-            except (PermissionError, OSError):
+            else:
                 # Fall back to .searchengine/data in home directory
                 base_dir = Path.home()
                 return base_dir / '.searchengine' / 'data'
@@ -156,12 +208,10 @@ class Config:
             base_dir = Path(os.environ.get('TEMP', Path.home() / 'AppData/Local/Temp'))
         else:  # Unix-like
             xdg_cache = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
-            try:
-                # Test if we can write to the XDG cache directory
-                test_dir = xdg_cache / 'searchengine'
-                test_dir.mkdir(parents=True, exist_ok=True)
+            # Use the XDG cache directory if we can write to it
+            if _can_create_dir(xdg_cache / 'searchengine'):
                 base_dir = xdg_cache
-            except (PermissionError, OSError):
+            else:
                 # Fall back to .searchengine/cache in home directory
                 base_dir = Path.home()
                 return base_dir / '.searchengine' / 'cache'
@@ -171,78 +221,76 @@ class Config:
     def _load_from_file(self, config_file: Path):
         """Load configuration from file"""
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                if config_file.suffix.lower() in ['.yaml', '.yml']:
-                    data = yaml.safe_load(f)
-                else:
-                    data = json.load(f)
-            
+            data = self._read_config_file(config_file)
             self._apply_config_data(data)
             logger.info(f"Configuration loaded from {config_file}")
-            
+        
         except Exception as e:
             logger.warning(f"Failed to load configuration from {config_file}: {e}")
     
-    def _apply_config_data(self, data: Dict[str, Any]):
-        """Apply configuration data to config objects"""
-        if 'search' in data:
-            search_data = data['search']
-            self.search.results_per_page = search_data.get('results_per_page', self.search.results_per_page)
-            self.search.default_timeout = search_data.get('default_timeout', self.search.default_timeout)
-            self.search.max_retries = search_data.get('max_retries', self.search.max_retries)
-            self.search.user_agent = search_data.get('user_agent', self.search.user_agent)
-            self.search.request_delay = search_data.get('request_delay', self.search.request_delay)
+    def _read_config_file(self, config_file: Path) -> Dict[str, Any]:
+        """Parse a config file, reusing the cached parse while the file is unchanged"""
+        if not self._use_parsed_cache:
+            return self._parse_config_file(config_file)
         
-        if 'display' in data:
-            display_data = data['display']
-            self.display.colors = display_data.get('colors', self.display.colors)
-            self.display.animations = display_data.get('animations', self.display.animations)
-            self.display.unicode_symbols = display_data.get('unicode_symbols', self.display.unicode_symbols)
-            self.display.max_snippet_length = display_data.get('max_snippet_length', self.display.max_snippet_length)
-            self.display.show_metadata = display_data.get('show_metadata', self.display.show_metadata)
-        
-        if 'cache' in data:
-            cache_data = data['cache']
-            self.cache.enabled = cache_data.get('enabled', self.cache.enabled)
-            self.cache.search_ttl = cache_data.get('search_ttl', self.cache.search_ttl)
-            self.cache.max_size = cache_data.get('max_size', self.cache.max_size)
-            self.cache.cleanup_interval = cache_data.get('cleanup_interval', self.cache.cleanup_interval)
+        st = os.stat(config_file)
+        path = str(Path(config_file).resolve())
+        key = (path, st.st_mtime_ns, st.st_size)
+        cache_file = self.cache_dir / _PARSED_CACHE_FILE
+        try:
+            blob = _parsed_memo.get(path) or cache_file.read_bytes()
+            cached_key, data = marshal.loads(blob)
+            if tuple(cached_key) == key:
+                _parsed_memo[path] = blob
+                return data
+        except Exception:
+            pass  # Missing, stale format or unreadable cache
         
-        if 'history' in data:
-            history_data = data['history']
-            self.history.max_entries = history_data.get('max_entries', self.history.max_entries)
-            self.history.save_to_file = history_data.get('save_to_file', self.history.save_to_file)
-            self.history.auto_cleanup_days = history_data.get('auto_cleanup_days', self.history.auto_cleanup_days)
+        data = self._parse_config_file(config_file)
+        try:
+            # marshal only handles plain values, so YAML dates etc. skip the cache
+            blob = marshal.dumps((key, data))
+            _parsed_memo[path] = blob
+            cache_file.write_bytes(blob)
+        except (ValueError, OSError) as e:
+            logger.debug(f"Not caching parsed configuration: {e}")
+        return data
+    
+    def _parse_config_file(self, config_file: Path) -> Dict[str, Any]:
+        """Parse a YAML or JSON config file"""
+        with open(config_file, 'r', encoding='utf-8') as f:
+            if config_file.suffix.lower() in ['.yaml', '.yml']:
+                # PyYAML is only imported for YAML files; prefer libyaml's loader
+                import yaml
+                return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+            return json.load(f)
+    
+    def apply_overrides(self, overrides: Dict[str, Dict[str, Any]]):
+        """
+        Apply section overrides in the same shape as the config file
         
-        if 'api' in data:
-            api_data = data['api']
-            self.api.providers = api_data.get('providers', self.api.providers)
-            self.api.default_provider = api_data.get('default_provider', self.api.default_provider)
-            self.api.api_keys = api_data.get('api_keys', self.api.api_keys)
-            self.api.rate_limits = api_data.get('rate_limits', self.api.rate_limits)
+        Args:
+            overrides: Mapping of section name to the settings to change
+        """
+        self._apply_config_data(overrides)
+    
+    def _apply_config_data(self, data: Dict[str, Any]):
+        """Apply configuration data to config objects"""
+        for section, field_names in _SECTION_FIELDS.items():
+            section_data = data.get(section)
+            if not section_data:
+                continue
+            target = getattr(self, section)
+            for name in field_names:
+                if name in section_data:
+                    setattr(target, name, section_data[name])
     
     def _load_from_env(self):
         """Load configuration from environment variables"""
-        # Search configuration
-        if 'SEARCHENGINE_RESULTS_PER_PAGE' in os.environ:
-            self.search.results_per_page = int(os.environ['SEARCHENGINE_RESULTS_PER_PAGE'])
-        
-        if 'SEARCHENGINE_TIMEOUT' in os.environ:
-            self.search.default_timeout = int(os.environ['SEARCHENGINE_TIMEOUT'])
-        
-        if 'SEARCHENGINE_USER_AGENT' in os.environ:
-            self.search.user_agent = os.environ['SEARCHENGINE_USER_AGENT']
-        
-        # Display configuration
-        if 'SEARCHENGINE_NO_COLORS' in os.environ:
-            self.display.colors = False
-        
-        if 'SEARCHENGINE_NO_ANIMATIONS' in os.environ:
-            self.display.animations = False
-        
-        # API configuration
-        if 'SEARCHENGINE_DEFAULT_PROVIDER' in os.environ:
-            self.api.default_provider = os.environ['SEARCHENGINE_DEFAULT_PROVIDER']
+        environ = os.environ
+        for env_name, (section, name, convert) in _ENV_SETTINGS.items():
+            if env_name in environ:
+                setattr(getattr(self, section), name, convert(environ[env_name]))
         
         # Load API keys from environment
         for key, value in os.environ.items():
@@ -259,7 +307,9 @@ class Config:
                     'default_timeout': self.search.default_timeout,
                     'max_retries': self.search.max_retries,
                     'user_agent': self.search.user_agent,
-                    'request_delay': self.search.request_delay
+                    'request_delay': self.search.request_delay,
+                    'max_concurrent_requests': self.search.max_concurrent_requests,
+                    'simulate_latency': self.search.simulate_latency
                 },
                 'display': {
                     'colors': self.display.colors,
@@ -272,7 +322,8 @@ class Config:
                     'enabled': self.cache.enabled,
                     'search_ttl': self.cache.search_ttl,
                     'max_size': self.cache.max_size,
-                    'cleanup_interval': self.cache.cleanup_interval
+                    'cleanup_interval': self.cache.cleanup_interval,
+                    'metadata_ttl': self.cache.metadata_ttl
                 },
                 'history': {
                     'max_entries': self.history.max_entries,
@@ -288,10 +339,10 @@ class Config:
             }
             
             with open(config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(default_config, f, default_flow_style=False, indent=2)
+                json.dump(default_config, f, indent=2)
             
             logger.info(f"Default configuration saved to {config_file}")
-            
+        
         except Exception as e:
             logger.warning(f"Failed to save default configuration: {e}")
     
@@ -303,7 +354,9 @@ class Config:
                 'default_timeout': self.search.default_timeout,
                 'max_retries': self.search.max_retries,
                 'user_agent': self.search.user_agent,
-                'request_delay': self.search.request_delay
+                'request_delay': self.search.request_delay,
+                'max_concurrent_requests': self.search.max_concurrent_requests,
+                'simulate_latency': self.search.simulate_latency
             },
             'display': {
                 'colors': self.display.colors,
@@ -316,7 +369,8 @@ class Config:
                 'enabled': self.cache.enabled,
                 'search_ttl': self.cache.search_ttl,
                 'max_size': self.cache.max_size,
-                'cleanup_interval': self.cache.cleanup_interval
+                'cleanup_interval': self.cache.cleanup_interval,
+                'metadata_ttl': self.cache.metadata_ttl
             },
             'history': {
                 'max_entries': self.history.max_entries,
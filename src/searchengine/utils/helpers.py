@@ -4,12 +4,19 @@ SearchEngine Pro - Helper Utilities
 Common utility functions used throughout the application.
 """
 
+import importlib
+import io
+import os
 import re
+import sys
 import logging
 import time
-from typing import Any
+from typing import Any, Callable, Dict, List, Tuple
 from pathlib import Path
 
+# dataclass(slots=True) needs Python 3.10; older versions keep __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def setup_logging(level: int = logging.INFO):
     """Setup logging configuration"""
@@ -20,6 +27,35 @@ def setup_logging(level: int = logging.INFO):
     )
 
 
+class RecordBufferedFile(io.TextIOWrapper):
+    """
+    Text file that only writes to disk at record boundaries
+    
+    rich flushes its file after every print, which would turn each line into
+    a write syscall. flush() is therefore a no-op here; data is written when
+    the buffer fills, on commit() and on close().
+    """
+    
+    def flush(self):
+        pass
+    
+    def commit(self):
+        """Write everything buffered so far"""
+        super().flush()
+    
+    def close(self):
+        if not self.closed:
+            super().flush()
+        super().close()
+
+
+def open_buffered_output(path: str, buffer_size: int = 1 << 20) -> RecordBufferedFile:
+    """Open a text file for writing behind a large write buffer"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+    raw = os.fdopen(os.open(path, flags, 0o666), 'wb', buffering=0)
+    return RecordBufferedFile(io.BufferedWriter(raw, buffer_size=buffer_size), encoding='utf-8')
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in human-readable format"""
     if seconds < 1:
@@ -67,4 +103,30 @@ def validate_url(url: str) -> bool:
         r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
         r'(?::\d+)?'  # optional port
         r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    return url_pattern.match(url) is not None 
\ No newline at end of file
+    return url_pattern.match(url) is not None 
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build a package's __getattr__ and __dir__ for names imported on first access
+    
+    exports maps each exported name to the relative module defining it.
+    The imported value is stored on the package, so later lookups skip
+    __getattr__ (PEP 562).
+    """
+    namespace = sys.modules[package].__dict__
+    
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+    
+    return __getattr__, __dir__
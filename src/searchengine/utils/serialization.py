@@ -0,0 +1,46 @@
+"""
+SearchEngine Pro - JSON Serialization
+
+Thin JSON shim that uses orjson when it is installed and falls back to
+the standard library otherwise. dumps() always returns UTF-8 bytes.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(
+    obj: Any,
+    *,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+    indent: bool = False
+) -> bytes:
+    """Serialize obj to JSON bytes, pretty-printed with two spaces if indent is set"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    if indent:
+        return json.dumps(
+            obj, sort_keys=sort_keys, default=default, ensure_ascii=False, indent=2
+        ).encode('utf-8')
+    return json.dumps(
+        obj, sort_keys=sort_keys, default=default, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Deserialize JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)